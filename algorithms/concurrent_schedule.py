@@ -3,15 +3,197 @@ Implementación del algoritmo Concurrent Schedule para el problema MDVSP.
 Algoritmo constructivo que asigna viajes a vehículos de manera secuencial.
 """
 
+import sys
 import time
-from typing import List, Tuple, Optional, Set
-from memory_profiler import profile
+from functools import lru_cache
+from typing import Callable, List, Tuple, Optional
 import numpy as np
+from numba import njit, prange
 
 from data.mdvsp_data_model import MDVSPData
 from .solution_model import SolucionMDVSP, Ruta
 
 
+def _preparar_matriz_puntuacion(instancia: MDVSPData) -> Tuple[np.ndarray, float]:
+    """
+    Obtiene la matriz con la que se puntúan las inserciones y su costo centinela.
+    
+    Las instancias tienen costos enteros, así que se puntúa en int32: la matriz y los
+    costos de inserción ocupan la mitad que en float64. Si algún costo no es entero o
+    las sumas de tres costos podrían desbordar int32, se conserva la matriz float64.
+    Una matriz que ya es int32 (la que entrega el cargador) se usa sin copiarla.
+    
+    Args:
+        instancia: Datos de la instancia
+        
+    Returns:
+        Tupla (matriz de puntuación, costo que marca una inserción infactible)
+    """
+    matriz = instancia.matriz_viajes
+    limite_entero = np.iinfo(np.int32).max
+    
+    if (matriz.size and matriz.min() >= 0 and 3 * float(matriz.max()) < limite_entero
+            and (matriz.dtype == np.int32 or np.array_equal(matriz, np.rint(matriz)))):
+        return matriz.astype(np.int32, copy=False), limite_entero
+    
+    return matriz, np.inf
+
+
+@lru_cache(maxsize=None)
+def _construir_kernel_insercion(costo_infactible: float) -> Callable[..., None]:
+    """
+    Compila el kernel de inserción con el costo infactible fijado como constante.
+    
+    El valor queda capturado en la clausura, por lo que Numba lo trata como una
+    constante de compilación. Se compila una vez por valor distinto y el resultado
+    se reutiliza (y se guarda en caché en disco) entre instancias.
+    
+    Args:
+        costo_infactible: Valor que marca una conexión infactible
+        
+    Returns:
+        Kernel compilado que calcula la mejor inserción de todos los viajes en una ruta
+    """
+    @njit(cache=True)
+    def mejor_insercion_ruta(matriz: np.ndarray, viajes_ruta: np.ndarray, n_ruta: int,
+                             indice_deposito: int, orden_inicio: np.ndarray,
+                             inicios_ordenados: np.ndarray, tiempos_inicio: np.ndarray,
+                             tiempos_fin: np.ndarray, sin_insercion: float,
+                             costos: np.ndarray, posiciones: np.ndarray) -> None:
+        """
+        Calcula el mejor costo y posición de inserción de todos los viajes en una ruta no vacía.
+        
+        La ruta está ordenada en el tiempo, así que cada posición solo admite viajes cuyo
+        inicio cae entre el fin del viaje anterior y el inicio del siguiente. Con los
+        viajes ordenados por inicio, ese rango se obtiene con una búsqueda binaria y el
+        resto de viajes no se evalúa.
+        
+        Args:
+            matriz: Matriz de costos de la instancia
+            viajes_ruta: Viajes de la ruta en orden
+            n_ruta: Número de viajes de la ruta
+            indice_deposito: Índice del depósito de la ruta en la matriz
+            orden_inicio: Viajes ordenados por tiempo de inicio
+            inicios_ordenados: Tiempos de inicio en el orden de orden_inicio
+            tiempos_inicio: Tiempos de inicio de todos los viajes
+            tiempos_fin: Tiempos de fin de todos los viajes
+            sin_insercion: Costo que marca una inserción infactible en los vectores de salida
+            costos: Vector de salida con el mejor costo por viaje (sin_insercion si no es factible)
+            posiciones: Vector de salida con la mejor posición por viaje (-1 si no es factible)
+        """
+        costos[:] = sin_insercion
+        posiciones[:] = -1
+        numero_viajes = orden_inicio.shape[0]
+        
+        for posicion in range(n_ruta + 1):
+            # Rango de viajes cuyo inicio es compatible con los vecinos de la posición
+            if posicion > 0:
+                anterior = viajes_ruta[posicion - 1]
+                desde = np.searchsorted(inicios_ordenados, tiempos_fin[anterior], side='left')
+            else:
+                anterior = indice_deposito
+                desde = 0
+            
+            if posicion < n_ruta:
+                siguiente = viajes_ruta[posicion]
+                limite_fin = tiempos_inicio[siguiente]
+                hasta = np.searchsorted(inicios_ordenados, limite_fin, side='right')
+            else:
+                siguiente = indice_deposito
+                limite_fin = np.inf
+                hasta = numero_viajes
+            
+            costo_arco_actual = matriz[anterior, siguiente]
+            
+            for k in range(desde, hasta):
+                id_viaje = orden_inicio[k]
+                if tiempos_fin[id_viaje] > limite_fin:
+                    continue
+                
+                # La infactibilidad por costo se incorpora al valor (sin_insercion) sin saltos
+                costo = matriz[anterior, id_viaje] + matriz[id_viaje, siguiente] - costo_arco_actual
+                costo = costo if costo != costo_infactible else sin_insercion
+                
+                # Recorrido por posición creciente: el empate conserva la primera posición
+                if costo < costos[id_viaje]:
+                    costos[id_viaje] = costo
+                    posiciones[id_viaje] = posicion
+    
+    return mejor_insercion_ruta
+
+
+@njit(parallel=True, cache=True)
+def _actualizar_candidatos_kernel(costos_insercion: np.ndarray, id_ruta: int,
+                                  viajes_pendientes: np.ndarray, mejor_costo_viaje: np.ndarray,
+                                  mejor_ruta_viaje: np.ndarray, limites_deposito: np.ndarray,
+                                  rutas_abiertas: np.ndarray) -> None:
+    """
+    Actualiza en paralelo la mejor ruta de cada viaje pendiente tras modificar una ruta.
+    
+    Cada viaje solo lee su columna de costos y escribe sus propias entradas, así que
+    los viajes se reparten entre hilos sin sincronización. Al recorrer una columna
+    solo se visitan las rutas abiertas de cada depósito.
+    
+    Args:
+        costos_insercion: Matriz (rutas, viajes) de costos de inserción vigentes
+        id_ruta: Ruta que acaba de cambiar
+        viajes_pendientes: Máscara booleana de viajes aún no asignados
+        mejor_costo_viaje: Mejor costo de inserción por viaje
+        mejor_ruta_viaje: Ruta que alcanza el mejor costo por viaje
+        limites_deposito: Primer ID de ruta de cada depósito (y el total al final)
+        rutas_abiertas: Número de rutas abiertas por depósito (las primeras del depósito)
+    """
+    numero_viajes = costos_insercion.shape[1]
+    numero_depositos = rutas_abiertas.shape[0]
+    
+    for id_viaje in prange(numero_viajes):
+        if not viajes_pendientes[id_viaje]:
+            continue
+        
+        if mejor_ruta_viaje[id_viaje] == id_ruta:
+            # Dependía de la ruta modificada: nuevo mínimo de la columna (primer índice en empate)
+            mejor_ruta = -1
+            mejor_costo = costos_insercion[id_ruta, id_viaje]
+            for deposito in range(numero_depositos):
+                primera_ruta = limites_deposito[deposito]
+                for ruta in range(primera_ruta, primera_ruta + rutas_abiertas[deposito]):
+                    if mejor_ruta < 0 or costos_insercion[ruta, id_viaje] < mejor_costo:
+                        mejor_costo = costos_insercion[ruta, id_viaje]
+                        mejor_ruta = ruta
+            mejor_ruta_viaje[id_viaje] = mejor_ruta
+            mejor_costo_viaje[id_viaje] = mejor_costo
+        else:
+            # La ruta modificada solo puede mejorar el candidato actual
+            costo = costos_insercion[id_ruta, id_viaje]
+            if (costo < mejor_costo_viaje[id_viaje] or
+                    (costo == mejor_costo_viaje[id_viaje] and id_ruta < mejor_ruta_viaje[id_viaje])):
+                mejor_ruta_viaje[id_viaje] = id_ruta
+                mejor_costo_viaje[id_viaje] = costo
+
+
+@njit(cache=True)
+def _insertar_viaje_kernel(viajes_rutas: np.ndarray, longitudes: np.ndarray, costos_rutas: np.ndarray,
+                           id_ruta: int, posicion: int, id_viaje: int, costo_asignacion: float) -> None:
+    """
+    Inserta un viaje en el buffer de una ruta desplazando su cola una posición.
+    
+    Args:
+        viajes_rutas: Buffers de secuencias de viajes por ruta
+        longitudes: Número de viajes de cada ruta
+        costos_rutas: Costo acumulado de cada ruta
+        id_ruta: ID de la ruta destino
+        posicion: Posición de inserción
+        id_viaje: ID del viaje a insertar
+        costo_asignacion: Costo de la asignación
+    """
+    n_ruta = longitudes[id_ruta]
+    for indice in range(n_ruta, posicion, -1):
+        viajes_rutas[id_ruta, indice] = viajes_rutas[id_ruta, indice - 1]
+    viajes_rutas[id_ruta, posicion] = id_viaje
+    longitudes[id_ruta] = n_ruta + 1
+    costos_rutas[id_ruta] += costo_asignacion
+
+
 class ConcurrentScheduleAlgorithm:
     """
     Implementación del algoritmo Concurrent Schedule para MDVSP.
@@ -27,8 +209,10 @@ class ConcurrentScheduleAlgorithm:
         """
         self.verbose = verbose
         self.estadisticas_ejecucion = {}
+        
+        # Progreso cada 64 asignaciones (máscara de bits); -1 nunca coincide y lo desactiva
+        self._mascara_progreso = 0x3F if verbose else -1
     
-    @profile
     def resolver(self, instancia: MDVSPData) -> SolucionMDVSP:
         """
         Resuelve una instancia MDVSP usando Concurrent Schedule.
@@ -39,7 +223,7 @@ class ConcurrentScheduleAlgorithm:
         Returns:
             Solución construida por el algoritmo
         """
-        inicio_tiempo = time.perf_counter()
+        inicio_tiempo = time.perf_counter_ns()
         
         if self.verbose:
             print(f"\n=== Resolviendo {instancia.nombre_archivo_instancia} ===")
@@ -47,39 +231,112 @@ class ConcurrentScheduleAlgorithm:
         
         # Inicializa estructuras de datos
         solucion = self._inicializar_solucion(instancia)
-        viajes_pendientes = set(range(instancia.numero_viajes))
+        viajes_pendientes = np.ones(instancia.numero_viajes, dtype=bool)
+        
+        # Matriz de puntuación (int32 si los costos lo permiten) y su centinela de infactibilidad
+        matriz_puntuacion, sin_insercion = _preparar_matriz_puntuacion(instancia)
+        
+        # Viajes ordenados por inicio para acotar los candidatos de cada posición
+        orden_inicio = np.argsort(instancia.tiempos_inicio, kind='stable')
+        inicios_ordenados = instancia.tiempos_inicio[orden_inicio]
+        
+        # Índice en la matriz del depósito de cada ruta (fijo durante toda la construcción)
+        indices_deposito = np.array(
+            [instancia.numero_viajes + ruta.id_deposito for ruta in solucion.rutas], dtype=np.intp
+        )
+        
+        # Las rutas vacías de un depósito son idénticas: solo se evalúa la primera (ruta abierta)
+        # y al usarse se abre la siguiente. Las rutas de cada depósito tienen IDs consecutivos.
+        vehiculos_deposito = np.array(
+            [deposito.numero_vehiculos for deposito in instancia.depositos], dtype=np.intp
+        )
+        limites_deposito = np.concatenate(([0], np.cumsum(vehiculos_deposito)))
+        deposito_ruta = np.repeat(np.arange(len(vehiculos_deposito)), vehiculos_deposito)
+        rutas_abiertas = np.minimum(vehiculos_deposito, 1)
+        
+        # Secuencias de viajes por ruta (una fila por ruta) y su longitud
+        viajes_rutas = np.full((len(solucion.rutas), instancia.numero_viajes), -1, dtype=np.int32)
+        longitudes = np.zeros(len(solucion.rutas), dtype=np.int32)
+        costos_rutas = np.zeros(len(solucion.rutas))
+        indices_depositos = np.array(
+            [instancia.numero_viajes + deposito.id_deposito for deposito in instancia.depositos],
+            dtype=np.intp
+        )
+        costos_ruta_vacia = self._inicializar_costos_insercion(
+            instancia, indices_depositos, matriz_puntuacion, sin_insercion
+        )
+        costos_insercion = np.full(
+            (len(solucion.rutas), instancia.numero_viajes), sin_insercion, dtype=costos_ruta_vacia.dtype
+        )
+        con_vehiculos = vehiculos_deposito > 0
+        costos_insercion[limites_deposito[:-1][con_vehiculos]] = costos_ruta_vacia[con_vehiculos]
+        posiciones_insercion = np.zeros(costos_insercion.shape, dtype=np.int32)
+        
+        # Mejor ruta y costo de inserción por viaje
+        mejor_costo_viaje, mejor_ruta_viaje = self._inicializar_candidatos(costos_insercion)
+        
+        # El progreso solo se muestra en terminal; en logs basta el resumen final
+        mascara_progreso = self._mascara_progreso if sys.stdout.isatty() else -1
         
         # Estadísticas para debugging
         iteraciones = 0
         asignaciones_exitosas = 0
         
         # Ciclo principal: asigna viajes hasta que no queden pendientes
-        while viajes_pendientes:
+        viajes_restantes = instancia.numero_viajes
+        while viajes_restantes:
             iteraciones += 1
             
             # Encuentra la mejor asignación viaje-vehículo
             mejor_asignacion = self._encontrar_mejor_asignacion(
-                instancia, solucion, viajes_pendientes
+                mejor_costo_viaje, mejor_ruta_viaje, sin_insercion
             )
             
             if mejor_asignacion is None:
                 # No se puede asignar ningún viaje más
                 if self.verbose:
-                    print(f"  ⚠️  No se pueden asignar {len(viajes_pendientes)} viajes restantes")
+                    print(f"  ⚠️  No se pueden asignar {viajes_restantes} viajes restantes")
                 break
             
             # Realiza la asignación
             id_viaje, id_ruta, costo_asignacion = mejor_asignacion
-            self._asignar_viaje_a_ruta(instancia, solucion, id_viaje, id_ruta, costo_asignacion)
+            self._asignar_viaje_a_ruta(solucion, id_viaje, id_ruta, costo_asignacion,
+                                       posiciones_insercion[id_ruta, id_viaje], viajes_rutas,
+                                       longitudes, costos_rutas)
+            viajes_pendientes[id_viaje] = False
+            mejor_costo_viaje[id_viaje] = sin_insercion
+            viajes_restantes -= 1
+            
+            # Solo cambió la ruta modificada: recalcula su fila de costos y los candidatos afectados
+            costos_insercion[id_ruta], posiciones_insercion[id_ruta] = self._calcular_mejor_insercion(
+                instancia, indices_deposito[id_ruta], viajes_rutas[id_ruta], longitudes[id_ruta],
+                orden_inicio, inicios_ordenados, matriz_puntuacion, sin_insercion
+            )
+            self._actualizar_candidatos(
+                costos_insercion, id_ruta, viajes_pendientes, mejor_costo_viaje, mejor_ruta_viaje,
+                limites_deposito, rutas_abiertas
+            )
+            
+            # Si se estrenó la ruta abierta del depósito, pasa a evaluarse la siguiente vacía
+            if longitudes[id_ruta] == 1:
+                deposito = deposito_ruta[id_ruta]
+                siguiente_ruta = id_ruta + 1
+                if siguiente_ruta < limites_deposito[deposito + 1]:
+                    costos_insercion[siguiente_ruta] = costos_ruta_vacia[deposito]
+                    rutas_abiertas[deposito] += 1
+                    self._actualizar_candidatos(
+                        costos_insercion, siguiente_ruta, viajes_pendientes, mejor_costo_viaje,
+                        mejor_ruta_viaje, limites_deposito, rutas_abiertas
+                    )
             
-            viajes_pendientes.remove(id_viaje)
             asignaciones_exitosas += 1
             
-            if self.verbose and (asignaciones_exitosas % 20 == 0):
+            if asignaciones_exitosas & mascara_progreso == 0:
                 print(f"  Asignados: {asignaciones_exitosas}/{instancia.numero_viajes}")
         
         # Finaliza la solución
-        tiempo_total = time.perf_counter() - inicio_tiempo
+        self._materializar_rutas(instancia, solucion, viajes_rutas, longitudes, costos_rutas)
+        tiempo_total = (time.perf_counter_ns() - inicio_tiempo) * 1e-9
         solucion.tiempo_construccion = tiempo_total
         solucion.calcular_metricas(instancia.numero_viajes)
         
@@ -88,7 +345,7 @@ class ConcurrentScheduleAlgorithm:
             'iteraciones': iteraciones,
             'asignaciones_exitosas': asignaciones_exitosas,
             'tiempo_ejecucion': tiempo_total,
-            'viajes_no_asignados': len(viajes_pendientes)
+            'viajes_no_asignados': viajes_restantes
         }
         
         if self.verbose:
@@ -107,13 +364,16 @@ class ConcurrentScheduleAlgorithm:
         Returns:
             Solución inicializada con rutas vacías
         """
-        solucion = SolucionMDVSP(nombre_instancia=instancia.nombre_archivo_instancia)
+        solucion = SolucionMDVSP(
+            nombre_instancia=instancia.nombre_archivo_instancia,
+            viajes_asignados=np.zeros(instancia.numero_viajes, dtype=bool)
+        )
         
         # Crea una ruta por cada vehículo disponible
         id_vehiculo_global = 0
         for deposito in instancia.depositos:
             for _ in range(deposito.numero_vehiculos):
-                ruta = Ruta(
+                ruta = Ruta.adquirir(
                     id_vehiculo=id_vehiculo_global,
                     id_deposito=deposito.id_deposito
                 )
@@ -122,272 +382,177 @@ class ConcurrentScheduleAlgorithm:
         
         return solucion
     
-    def _encontrar_mejor_asignacion(self, instancia: MDVSPData, solucion: SolucionMDVSP,
-                                   viajes_pendientes: Set[int]) -> Optional[Tuple[int, int, float]]:
+    def _inicializar_costos_insercion(self, instancia: MDVSPData, indices_deposito: np.ndarray,
+                                      matriz: np.ndarray, sin_insercion: float) -> np.ndarray:
         """
-        Encuentra la mejor asignación viaje-vehículo basada en costo mínimo.
+        Construye la matriz de costos de inserción de cada viaje en una ruta vacía.
+        
+        Para una ruta vacía el costo es depósito -> viaje -> depósito; es infactible
+        (sin_insercion) si alguno de los dos tramos lo es.
         
         Args:
             instancia: Datos de la instancia
-            solucion: Solución actual
-            viajes_pendientes: Conjunto de viajes aún no asignados
+            indices_deposito: Índice en la matriz de cada depósito a evaluar
+            matriz: Matriz de puntuación de la instancia
+            sin_insercion: Costo que marca una inserción infactible
             
         Returns:
-            Tupla (id_viaje, id_ruta, costo) de la mejor asignación o None si no hay factibles
+            Matriz (depósitos, viajes) con el costo de asignar cada viaje a una ruta vacía
         """
-        mejor_asignacion = None
-        menor_costo = float('inf')
+        numero_viajes = instancia.numero_viajes
+        costo_ida = matriz[indices_deposito, :numero_viajes]
+        costo_vuelta = matriz[:numero_viajes, indices_deposito].T
+        infactible = ((costo_ida == instancia.COSTO_INFACTIBLE) |
+                      (costo_vuelta == instancia.COSTO_INFACTIBLE))
         
-        # Evalúa cada viaje pendiente
-        for id_viaje in viajes_pendientes:
-            viaje = instancia.viajes[id_viaje]
-            
-            # Evalúa cada ruta (vehículo)
-            for id_ruta, ruta in enumerate(solucion.rutas):
-                costo_asignacion = self._calcular_costo_asignacion(
-                    instancia, ruta, viaje
-                )
-                
-                if costo_asignacion is not None and costo_asignacion < menor_costo:
-                    menor_costo = costo_asignacion
-                    mejor_asignacion = (id_viaje, id_ruta, costo_asignacion)
+        costos = costo_ida + costo_vuelta
+        costos[infactible] = sin_insercion
         
-        return mejor_asignacion
+        return costos
     
-    def _calcular_costo_asignacion(self, instancia: MDVSPData, ruta: Ruta,
-                                  viaje) -> Optional[float]:
+    def _inicializar_candidatos(self, costos_insercion: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calcula el costo de asignar un viaje a una ruta específica.
+        Calcula la mejor ruta de inserción de cada viaje.
         
         Args:
-            instancia: Datos de la instancia
-            ruta: Ruta donde se evaluaría la asignación
-            viaje: Viaje a evaluar
+            costos_insercion: Matriz (rutas, viajes) de costos de inserción vigentes
             
         Returns:
-            Costo de la asignación o None si no es factible
+            Tupla (mejor costo por viaje, mejor ruta por viaje)
         """
-        # Índices en la matriz de costos
-        indice_viaje = viaje.id_viaje
-        indice_deposito = instancia.numero_viajes + ruta.id_deposito
-        
-        if ruta.es_vacia():
-            # Ruta vacía: costo desde depósito al viaje + viaje al depósito
-            costo_ida = instancia.obtener_costo(indice_deposito, indice_viaje)
-            costo_vuelta = instancia.obtener_costo(indice_viaje, indice_deposito)
-            
-            # Verifica factibilidad
-            if (costo_ida == instancia.COSTO_INFACTIBLE or 
-                costo_vuelta == instancia.COSTO_INFACTIBLE):
-                return None
-            
-            return costo_ida + costo_vuelta
+        mejor_ruta_viaje = np.argmin(costos_insercion, axis=0)
+        mejor_costo_viaje = costos_insercion[mejor_ruta_viaje, np.arange(costos_insercion.shape[1])]
         
-        else:
-            # Ruta con viajes: busca la mejor posición para insertar
-            return self._calcular_mejor_insercion(instancia, ruta, viaje)
+        return mejor_costo_viaje, mejor_ruta_viaje
     
-    def _calcular_mejor_insercion(self, instancia: MDVSPData, ruta: Ruta,
-                                 viaje) -> Optional[float]:
+    def _actualizar_candidatos(self, costos_insercion: np.ndarray, id_ruta: int,
+                               viajes_pendientes: np.ndarray, mejor_costo_viaje: np.ndarray,
+                               mejor_ruta_viaje: np.ndarray, limites_deposito: np.ndarray,
+                               rutas_abiertas: np.ndarray) -> None:
         """
-        Calcula el mejor costo de inserción de un viaje en una ruta existente.
+        Actualiza la mejor ruta de los viajes pendientes tras modificar una ruta.
+        
+        Los viajes cuya mejor ruta era la modificada se reevalúan sobre las rutas abiertas;
+        el resto solo se compara contra la nueva fila de la ruta modificada. Los viajes
+        se procesan en paralelo.
         
         Args:
-            instancia: Datos de la instancia
-            ruta: Ruta existente
-            viaje: Viaje a insertar
-            
-        Returns:
-            Mejor costo de inserción o None si no es factible
+            costos_insercion: Matriz (rutas, viajes) de costos de inserción vigentes
+            id_ruta: Ruta que acaba de cambiar
+            viajes_pendientes: Máscara booleana de viajes aún no asignados
+            mejor_costo_viaje: Mejor costo de inserción por viaje
+            mejor_ruta_viaje: Ruta que alcanza el mejor costo por viaje
+            limites_deposito: Primer ID de ruta de cada depósito (y el total al final)
+            rutas_abiertas: Número de rutas abiertas por depósito
         """
-        mejor_costo = float('inf')
-        indice_nuevo_viaje = viaje.id_viaje
-        indice_deposito = instancia.numero_viajes + ruta.id_deposito
-        
-        # Evalúa inserción al inicio de la ruta
-        primer_viaje = ruta.viajes[0]
-        costo_inicio = (
-            instancia.obtener_costo(indice_deposito, indice_nuevo_viaje) +
-            instancia.obtener_costo(indice_nuevo_viaje, primer_viaje) -
-            instancia.obtener_costo(indice_deposito, primer_viaje)
+        _actualizar_candidatos_kernel(
+            costos_insercion, id_ruta, viajes_pendientes, mejor_costo_viaje, mejor_ruta_viaje,
+            limites_deposito, rutas_abiertas
         )
+    
+    def _encontrar_mejor_asignacion(self, mejor_costo_viaje: np.ndarray, mejor_ruta_viaje: np.ndarray,
+                                   sin_insercion: float) -> Optional[Tuple[int, int, float]]:
+        """
+        Encuentra la mejor asignación viaje-vehículo basada en costo mínimo.
         
-        # Verifica factibilidad temporal al inicio
-        if (self._es_factible_temporalmente(instancia, viaje, ruta.viajes[0], posicion='antes') and
-            costo_inicio != instancia.COSTO_INFACTIBLE):
-            mejor_costo = min(mejor_costo, costo_inicio)
+        Solo recorre el mejor candidato de cada viaje; los viajes ya asignados tienen
+        costo sin_insercion, así que no hace falta enmascararlos. Los empates se
+        resuelven a favor del viaje de menor índice y luego de la ruta de menor índice.
         
-        # Evalúa inserción entre viajes consecutivos
-        for i in range(len(ruta.viajes) - 1):
-            viaje_anterior = ruta.viajes[i]
-            viaje_siguiente = ruta.viajes[i + 1]
-            
-            costo_insercion = (
-                instancia.obtener_costo(viaje_anterior, indice_nuevo_viaje) +
-                instancia.obtener_costo(indice_nuevo_viaje, viaje_siguiente) -
-                instancia.obtener_costo(viaje_anterior, viaje_siguiente)
-            )
+        Args:
+            mejor_costo_viaje: Mejor costo de inserción por viaje
+            mejor_ruta_viaje: Ruta que alcanza el mejor costo por viaje
+            sin_insercion: Costo que marca una inserción infactible
             
-            # Verifica factibilidad temporal
-            if (self._es_factible_temporalmente(instancia, viaje, viaje_anterior, posicion='despues') and
-                self._es_factible_temporalmente(instancia, viaje, viaje_siguiente, posicion='antes') and
-                costo_insercion != instancia.COSTO_INFACTIBLE):
-                mejor_costo = min(mejor_costo, costo_insercion)
-        
-        # Evalúa inserción al final de la ruta
-        ultimo_viaje = ruta.viajes[-1]
-        costo_final = (
-            instancia.obtener_costo(ultimo_viaje, indice_nuevo_viaje) +
-            instancia.obtener_costo(indice_nuevo_viaje, indice_deposito) -
-            instancia.obtener_costo(ultimo_viaje, indice_deposito)
-        )
+        Returns:
+            Tupla (id_viaje, id_ruta, costo) de la mejor asignación o None si no hay factibles
+        """
+        id_viaje = int(np.argmin(mejor_costo_viaje))
+        costo = mejor_costo_viaje[id_viaje]
         
-        # Verifica factibilidad temporal al final
-        if (self._es_factible_temporalmente(instancia, viaje, ultimo_viaje, posicion='despues') and
-            costo_final != instancia.COSTO_INFACTIBLE):
-            mejor_costo = min(mejor_costo, costo_final)
+        if costo == sin_insercion:
+            return None
         
-        return mejor_costo if mejor_costo != float('inf') else None
+        return (id_viaje, int(mejor_ruta_viaje[id_viaje]), float(costo))
     
-    def _es_factible_temporalmente(self, instancia: MDVSPData, viaje_nuevo,
-                                  viaje_referencia, posicion: str) -> bool:
+    def _calcular_mejor_insercion(self, instancia: MDVSPData, indice_deposito: int,
+                                 viajes_ruta: np.ndarray,
+                                 n_ruta: int, orden_inicio: np.ndarray, inicios_ordenados: np.ndarray,
+                                 matriz: np.ndarray,
+                                 sin_insercion: float) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Verifica si es factible insertar un viaje respecto a otro temporalmente.
+        Calcula el mejor costo y posición de inserción de todos los viajes en una ruta existente.
         
         Args:
             instancia: Datos de la instancia
-            viaje_nuevo: Viaje a insertar
-            viaje_referencia: Viaje de referencia (índice)
-            posicion: 'antes' o 'despues' respecto al viaje de referencia
+            indice_deposito: Índice en la matriz del depósito de la ruta
+            viajes_ruta: Buffer con la secuencia de viajes de la ruta
+            n_ruta: Número de viajes de la ruta
+            orden_inicio: Viajes ordenados por tiempo de inicio
+            inicios_ordenados: Tiempos de inicio en el orden de orden_inicio
+            matriz: Matriz de puntuación de la instancia
+            sin_insercion: Costo que marca una inserción infactible
             
         Returns:
-            True si la inserción es factible temporalmente
+            Tupla (costo por viaje, posición por viaje); sin_insercion y -1 si no es factible
         """
-        viaje_ref_obj = instancia.viajes[viaje_referencia]
+        costos = np.empty(instancia.numero_viajes, dtype=matriz.dtype)
+        posiciones = np.empty(instancia.numero_viajes, dtype=np.int32)
         
-        if posicion == 'antes':
-            # El nuevo viaje debe terminar antes de que empiece el de referencia
-            return viaje_nuevo.tiempo_fin <= viaje_ref_obj.tiempo_inicio
-        elif posicion == 'despues':
-            # El nuevo viaje debe empezar después de que termine el de referencia
-            return viaje_nuevo.tiempo_inicio >= viaje_ref_obj.tiempo_fin
+        kernel = _construir_kernel_insercion(float(instancia.COSTO_INFACTIBLE))
+        kernel(
+            matriz, viajes_ruta, n_ruta, indice_deposito, orden_inicio, inicios_ordenados,
+            instancia.tiempos_inicio, instancia.tiempos_fin, sin_insercion, costos, posiciones
+        )
         
-        return False
+        return costos, posiciones
     
-    def _asignar_viaje_a_ruta(self, instancia: MDVSPData, solucion: SolucionMDVSP,
-                             id_viaje: int, id_ruta: int, costo_asignacion: float) -> None:
+    def _asignar_viaje_a_ruta(self, solucion: SolucionMDVSP, id_viaje: int, id_ruta: int,
+                             costo_asignacion: float, posicion: int, viajes_rutas: np.ndarray,
+                             longitudes: np.ndarray, costos_rutas: np.ndarray) -> None:
         """
         Asigna un viaje a una ruta específica.
         
         Args:
-            instancia: Datos de la instancia
             solucion: Solución donde realizar la asignación
             id_viaje: ID del viaje a asignar
             id_ruta: ID de la ruta destino
             costo_asignacion: Costo de la asignación
+            posicion: Posición de inserción calculada al evaluar la ruta
+            viajes_rutas: Buffers de secuencias de viajes por ruta
+            longitudes: Número de viajes de cada ruta
+            costos_rutas: Costo acumulado de cada ruta
         """
-        ruta = solucion.rutas[id_ruta]
-        viaje = instancia.viajes[id_viaje]
-        
-        if ruta.es_vacia():
-            # Primera asignación a la ruta
-            ruta.agregar_viaje(id_viaje, costo_asignacion, viaje.tiempo_inicio, viaje.tiempo_fin)
-        else:
-            # Inserción en ruta existente - encuentra la mejor posición
-            mejor_posicion = self._encontrar_mejor_posicion_insercion(instancia, ruta, viaje)
-            
-            # Inserta el viaje en la posición óptima
-            ruta.viajes.insert(mejor_posicion, id_viaje)
-            ruta.costo_total += costo_asignacion
-            
-            # Actualiza ventana temporal
-            if viaje.tiempo_inicio < ruta.tiempo_inicio:
-                ruta.tiempo_inicio = viaje.tiempo_inicio
-            if viaje.tiempo_fin > ruta.tiempo_fin:
-                ruta.tiempo_fin = viaje.tiempo_fin
+        _insertar_viaje_kernel(viajes_rutas, longitudes, costos_rutas,
+                               id_ruta, posicion, id_viaje, costo_asignacion)
         
         # Actualiza la solución
-        solucion.viajes_asignados.add(id_viaje)
+        solucion.viajes_asignados[id_viaje] = True
     
-    def _encontrar_mejor_posicion_insercion(self, instancia: MDVSPData, ruta: Ruta, viaje) -> int:
+    def _materializar_rutas(self, instancia: MDVSPData, solucion: SolucionMDVSP,
+                            viajes_rutas: np.ndarray, longitudes: np.ndarray,
+                            costos_rutas: np.ndarray) -> None:
         """
-        Encuentra la mejor posición para insertar un viaje en una ruta.
-        
-        Args:
-            instancia: Datos de la instancia
-            ruta: Ruta donde insertar
-            viaje: Viaje a insertar
-            
-        Returns:
-            Índice de la mejor posición de inserción
-        """
-        mejor_posicion = 0
-        menor_incremento = float('inf')
-        
-        # Evalúa todas las posiciones posibles
-        for pos in range(len(ruta.viajes) + 1):
-            incremento_costo = self._calcular_incremento_costo_posicion(
-                instancia, ruta, viaje, pos
-            )
-            
-            if incremento_costo is not None and incremento_costo < menor_incremento:
-                menor_incremento = incremento_costo
-                mejor_posicion = pos
+        Vuelca los buffers de construcción en las rutas de la solución.
         
-        return mejor_posicion
-    
-    def _calcular_incremento_costo_posicion(self, instancia: MDVSPData, ruta: Ruta,
-                                          viaje, posicion: int) -> Optional[float]:
-        """
-        Calcula el incremento de costo de insertar en una posición específica.
+        La ventana temporal de cada ruta se calcula una sola vez al final en lugar
+        de actualizarse en cada inserción.
         
         Args:
             instancia: Datos de la instancia
-            ruta: Ruta destino
-            viaje: Viaje a insertar
-            posicion: Posición de inserción (0 = inicio, len(viajes) = final)
-            
-        Returns:
-            Incremento de costo o None si no es factible
+            solucion: Solución cuyas rutas se completan
+            viajes_rutas: Buffers de secuencias de viajes por ruta
+            longitudes: Número de viajes de cada ruta
+            costos_rutas: Costo acumulado de cada ruta
         """
-        indice_nuevo_viaje = viaje.id_viaje
-        indice_deposito = instancia.numero_viajes + ruta.id_deposito
-        
-        if posicion == 0:
-            # Inserción al inicio
-            if len(ruta.viajes) == 0:
-                return 0.0  # Ya calculado en _calcular_costo_asignacion
-            
-            primer_viaje = ruta.viajes[0]
-            if not self._es_factible_temporalmente(instancia, viaje, primer_viaje, 'antes'):
-                return None
-            
-            return (instancia.obtener_costo(indice_deposito, indice_nuevo_viaje) +
-                   instancia.obtener_costo(indice_nuevo_viaje, primer_viaje) -
-                   instancia.obtener_costo(indice_deposito, primer_viaje))
-        
-        elif posicion == len(ruta.viajes):
-            # Inserción al final
-            ultimo_viaje = ruta.viajes[-1]
-            if not self._es_factible_temporalmente(instancia, viaje, ultimo_viaje, 'despues'):
-                return None
-            
-            return (instancia.obtener_costo(ultimo_viaje, indice_nuevo_viaje) +
-                   instancia.obtener_costo(indice_nuevo_viaje, indice_deposito) -
-                   instancia.obtener_costo(ultimo_viaje, indice_deposito))
-        
-        else:
-            # Inserción en el medio
-            viaje_anterior = ruta.viajes[posicion - 1]
-            viaje_siguiente = ruta.viajes[posicion]
-            
-            if (not self._es_factible_temporalmente(instancia, viaje, viaje_anterior, 'despues') or
-                not self._es_factible_temporalmente(instancia, viaje, viaje_siguiente, 'antes')):
-                return None
+        for id_ruta, ruta in enumerate(solucion.rutas):
+            viajes_ruta = viajes_rutas[id_ruta, :longitudes[id_ruta]]
+            ruta.viajes.frombytes(viajes_ruta.tobytes())  # la ruta llega vacía de Ruta.adquirir
+            ruta.costo_total = float(costos_rutas[id_ruta])
             
-            return (instancia.obtener_costo(viaje_anterior, indice_nuevo_viaje) +
-                   instancia.obtener_costo(indice_nuevo_viaje, viaje_siguiente) -
-                   instancia.obtener_costo(viaje_anterior, viaje_siguiente))
+            if viajes_ruta.size:
+                ruta.tiempo_inicio = int(instancia.tiempos_inicio[viajes_ruta].min())
+                ruta.tiempo_fin = int(instancia.tiempos_fin[viajes_ruta].max())
     
     def obtener_estadisticas_algoritmo(self) -> dict:
         """
@@ -3,18 +3,82 @@ Ejecutor de experimentos para evaluar el algoritmo Concurrent Schedule en todas
 Maneja la carga de datos, ejecución del algoritmo y reporte de resultados.
 """
 
+import os
+import sys
 import time
+import hashlib
+import json
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from dataclasses import dataclass, astuple, asdict
 from pathlib import Path
 from typing import List, Dict, Optional
 import csv
-from memory_profiler import profile
+import numpy as np
 
+from data._cargador_comun import numero_procesos, crear_pool_procesos
 from data.mdvsp_data_loader import MDVSPDataLoader
 from data.mdvsp_data_model import MDVSPData
 from .concurrent_schedule import ConcurrentScheduleAlgorithm
 from .solution_model import SolucionMDVSP
 
 
+# Columnas de resultados y su tipo: cada columna se guarda en un arreglo NumPy propio
+COLUMNAS_RESULTADO = {
+    'instancia': object,
+    'numero_depositos': np.int64,
+    'numero_viajes': np.int64,
+    'vehiculos_disponibles': np.int64,
+    'costo_total': np.float64,
+    'vehiculos_usados': np.int64,
+    'viajes_asignados': np.int64,
+    'tiempo_construccion': np.float64,
+    'es_factible': np.bool_,
+    'rutas_activas': np.int64,
+    'viajes_por_ruta_promedio': np.float64,
+    'viajes_por_ruta_max': np.int64,
+    'viajes_por_ruta_min': np.int64,
+    'costo_por_vehiculo': np.float64,
+    'utilizacion_vehiculos': np.float64,
+    'error': object
+}
+
+# Versión de los resultados en caché; debe incrementarse al cambiar el algoritmo
+VERSION_CACHE_RESULTADOS = 1
+
+# Columnas sin valor (None) en los registros de instancias con error
+COLUMNAS_SOLO_EXITOSAS = (
+    'costo_total', 'vehiculos_usados', 'viajes_asignados', 'tiempo_construccion',
+    'rutas_activas', 'viajes_por_ruta_promedio', 'viajes_por_ruta_max',
+    'viajes_por_ruta_min', 'costo_por_vehiculo', 'utilizacion_vehiculos'
+)
+
+
+@dataclass(slots=True)
+class ResultadoInstancia:
+    """
+    Registro del resultado de una instancia; sus campos siguen el orden de COLUMNAS_RESULTADO.
+    Las instancias con error solo tienen los datos de la instancia y el mensaje de error.
+    """
+    instancia: str
+    numero_depositos: int
+    numero_viajes: int
+    vehiculos_disponibles: int
+    costo_total: Optional[float] = None
+    vehiculos_usados: Optional[int] = None
+    viajes_asignados: Optional[int] = None
+    tiempo_construccion: Optional[float] = None
+    es_factible: bool = False
+    rutas_activas: Optional[int] = None
+    viajes_por_ruta_promedio: Optional[float] = None
+    viajes_por_ruta_max: Optional[int] = None
+    viajes_por_ruta_min: Optional[int] = None
+    costo_por_vehiculo: Optional[float] = None
+    utilizacion_vehiculos: Optional[float] = None
+    error: Optional[str] = None
+
+
 class ExperimentRunner:
     """
     Ejecutor de experimentos que evalúa el algoritmo en múltiples instancias.
@@ -22,24 +86,49 @@ class ExperimentRunner:
     """
     
     def __init__(self, directorio_instancias: str = "fischetti", 
-                 directorio_resultados: str = "resultados") -> None:
+                 directorio_resultados: str = "resultados",
+                 directorio_cache: Optional[str] = None,
+                 procesos: Optional[int] = 1,
+                 verbose: Optional[bool] = None) -> None:
         """
         Inicializa el ejecutor de experimentos.
         
         Args:
             directorio_instancias: Directorio con instancias MDVSP
             directorio_resultados: Directorio para guardar resultados
+            directorio_cache: Directorio para conservar resultados e instancias ya leídas
+                entre ejecuciones (None = solo en memoria durante esta ejecución)
+            procesos: Número de procesos para resolver instancias en paralelo
+                (1 = secuencial en el proceso actual, por defecto; None = uno por CPU).
+                Los procesos del pool vuelven a importar el módulo principal del llamador,
+                que debe proteger su código con if __name__ == "__main__"
+            verbose: Si debe mostrar el progreso por instancia (None = solo en terminal
+                interactiva y fuera de CI)
         """
-        self.cargador = MDVSPDataLoader(directorio_instancias)
+        self.cargador = MDVSPDataLoader(directorio_instancias, directorio_cache)
         self.algoritmo = ConcurrentScheduleAlgorithm(verbose=False)
         self.directorio_resultados = Path(directorio_resultados)
         self.directorio_resultados.mkdir(exist_ok=True)
-        
-        self.resultados_experimento = []
-        self.instancias_cargadas = []
+        self.procesos = procesos
+        if verbose is None:
+            verbose = sys.stdout.isatty() and not os.environ.get('CI')
+        self.verbose = verbose
+        
+        self.resultados_experimento = self._crear_columnas_resultado(0)
+        self.numero_resultados = 0
+        self.nombres_instancias: List[str] = []
         self.tiempo_total_experimento = 0.0
+        
+        # CSV de resultados detallados, escrito fila a fila según se resuelven instancias
+        self._archivo_csv = None
+        self._escritor_csv = None
+        
+        # Registros ya calculados, indexados por el contenido de la instancia
+        self._cache_resultados: Dict[str, ResultadoInstancia] = {}
+        self.directorio_cache = Path(directorio_cache) if directorio_cache is not None else None
+        if self.directorio_cache is not None:
+            self.directorio_cache.mkdir(parents=True, exist_ok=True)
     
-    @profile
     def ejecutar_experimento_completo(self, limite_instancias: Optional[int] = None) -> Dict:
         """
         Ejecuta el experimento completo en todas las instancias disponibles.
@@ -51,79 +140,285 @@ class ExperimentRunner:
             Diccionario con resumen del experimento
         """
         print("=== INICIO DEL EXPERIMENTO MDVSP ===")
-        inicio_experimento = time.perf_counter()
-        
-        # Carga todas las instancias
-        print("\n1. Cargando instancias...")
-        self._cargar_instancias(limite_instancias)
+        inicio_experimento = time.perf_counter_ns()
         
-        # Ejecuta algoritmo en cada instancia
-        print(f"\n2. Ejecutando algoritmo en {len(self.instancias_cargadas)} instancias...")
-        self._ejecutar_algoritmo_todas_instancias()
+        # Lista las instancias; cada una se carga justo antes de resolverla
+        print("\n1. Buscando instancias...")
+        self._listar_instancias(limite_instancias)
         
-        # Genera reportes
-        print("\n3. Generando reportes...")
-        resumen = self._generar_reportes()
+        try:
+            # Ejecuta algoritmo en cada instancia
+            print(f"\n2. Ejecutando algoritmo en {len(self.nombres_instancias)} instancias...")
+            self._ejecutar_algoritmo_todas_instancias()
+            
+            # Genera reportes
+            print("\n3. Generando reportes...")
+            resumen = self._generar_reportes()
+        finally:
+            # Una ejecución interrumpida no deja el CSV abierto para la siguiente
+            self._cerrar_resultados_csv()
         
-        self.tiempo_total_experimento = time.perf_counter() - inicio_experimento
+        self.tiempo_total_experimento = (time.perf_counter_ns() - inicio_experimento) * 1e-9
         
         print(f"\n=== EXPERIMENTO COMPLETADO EN {self.tiempo_total_experimento:.2f}s ===")
         
         return resumen
     
-    def _cargar_instancias(self, limite: Optional[int]) -> None:
+    def _listar_instancias(self, limite: Optional[int]) -> None:
         """
-        Carga las instancias disponibles.
+        Obtiene los nombres de las instancias a procesar.
         
         Args:
-            limite: Número máximo de instancias a cargar
+            limite: Número máximo de instancias a procesar
         """
         instancias_disponibles = self.cargador.obtener_instancias_disponibles()
         
         if limite is not None:
             instancias_disponibles = instancias_disponibles[:limite]
         
+        self.nombres_instancias = instancias_disponibles
         print(f"  Instancias encontradas: {len(instancias_disponibles)}")
+    
+    def _cargar_instancia(self, nombre_instancia: str) -> Optional[MDVSPData]:
+        """
+        Carga una instancia informando del error si no se puede leer.
         
-        for i, nombre_instancia in enumerate(instancias_disponibles):
-            try:
-                instancia = self.cargador.cargar_instancia(nombre_instancia)
-                self.instancias_cargadas.append(instancia)
-                
-                if (i + 1) % 20 == 0:
-                    print(f"  Cargadas: {i + 1}/{len(instancias_disponibles)}")
-                    
-            except Exception as e:
-                print(f"  ✗ Error cargando {nombre_instancia}: {str(e)}")
+        Args:
+            nombre_instancia: Nombre de la instancia a cargar
+            
+        Returns:
+            Instancia cargada o None si hubo un error
+        """
+        try:
+            return self.cargador.cargar_instancia(nombre_instancia)
+        except Exception as e:
+            print(f"  ✗ Error cargando {nombre_instancia}: {str(e)}")
+            return None
+    
+    def _crear_columnas_resultado(self, numero_filas: int) -> Dict[str, np.ndarray]:
+        """
+        Reserva las columnas de resultados para un número dado de instancias.
         
-        print(f"  ✓ {len(self.instancias_cargadas)} instancias cargadas exitosamente")
+        Args:
+            numero_filas: Número de instancias a registrar
+            
+        Returns:
+            Diccionario columna -> arreglo NumPy de longitud numero_filas
+        """
+        return {columna: np.zeros(numero_filas, dtype=tipo) for columna, tipo in COLUMNAS_RESULTADO.items()}
     
-    def _ejecutar_algoritmo_todas_instancias(self) -> None:
-        """Ejecuta el algoritmo en todas las instancias cargadas."""
+    def _registrar_resultado(self, registro: ResultadoInstancia) -> None:
+        """
+        Escribe un registro en la siguiente fila de las columnas de resultados y en el CSV.
+        
+        Args:
+            registro: Resultado de una instancia
+        """
+        if self._escritor_csv is None:
+            self._abrir_resultados_csv()
+        valores_registro = astuple(registro)
+        self._escritor_csv.writerow(valores_registro)
+        
+        fila = self.numero_resultados
+        for valores, valor in zip(self.resultados_experimento.values(), valores_registro):
+            if valor is not None or valores.dtype == object:
+                valores[fila] = valor
+        
+        self.numero_resultados += 1
+    
+    def _obtener_registro(self, fila: int) -> ResultadoInstancia:
+        """
+        Reconstruye el registro de una instancia a partir de las columnas.
         
-        for i, instancia in enumerate(self.instancias_cargadas):
-            print(f"  [{i+1:3d}/{len(self.instancias_cargadas)}] {instancia.nombre_archivo_instancia}")
+        Args:
+            fila: Posición de la instancia en las columnas
             
-            try:
-                # Ejecuta algoritmo
-                solucion = self.algoritmo.resolver(instancia)
+        Returns:
+            Resultado de la instancia
+        """
+        registro = ResultadoInstancia(*(valores[fila].item() if valores.dtype != object else valores[fila]
+                                        for valores in self.resultados_experimento.values()))
+        
+        if registro.error is not None:
+            for columna in COLUMNAS_SOLO_EXITOSAS:
+                setattr(registro, columna, None)
+        
+        return registro
+    
+    def _mascara_exitosos(self) -> np.ndarray:
+        """
+        Obtiene la máscara de instancias resueltas sin error.
+        
+        Returns:
+            Arreglo booleano con una posición por resultado registrado
+        """
+        errores = self.resultados_experimento['error'][:self.numero_resultados]
+        return np.array([error is None for error in errores], dtype=bool)
+    
+    def _ejecutar_algoritmo_todas_instancias(self) -> None:
+        """
+        Carga y resuelve las instancias una a una.
+        
+        Solo se mantienen en memoria las instancias en curso: una en ejecución secuencial
+        y unas pocas por proceso con el pool, que resuelve mientras se cargan las siguientes.
+        """
+        total = len(self.nombres_instancias)
+        self.resultados_experimento = self._crear_columnas_resultado(total)
+        self.numero_resultados = 0
+        
+        procesos = numero_procesos(self.procesos, total)
+        ejecutor = crear_pool_procesos(procesos, total)
+        limite_en_curso = 2 * procesos if ejecutor is not None else 0
+        en_curso = deque()
+        
+        try:
+            # Los resultados se recogen en el orden de carga para conservar el orden del CSV
+            for i, nombre_instancia in enumerate(self.nombres_instancias):
+                instancia = self._cargar_instancia(nombre_instancia)
+                if instancia is None:
+                    continue
                 
-                # Guarda resultado
-                resultado = self._crear_registro_resultado(instancia, solucion)
-                self.resultados_experimento.append(resultado)
+                # Una instancia idéntica ya resuelta reutiliza su registro
+                clave = self._clave_instancia(instancia)
+                futuro = None
+                if ejecutor is not None and self._obtener_resultado_cache(clave) is None:
+                    try:
+                        futuro = ejecutor.submit(_resolver_instancia, instancia)
+                    except BrokenProcessPool as e:
+                        # Un proceso del pool terminó de forma abrupta: las instancias en curso
+                        # se registran con error y las restantes se resuelven en este proceso
+                        print(f"  ✗ Pool de procesos interrumpido, se continúa en secuencial: {e}")
+                        ejecutor.shutdown()
+                        ejecutor = None
+                        limite_en_curso = 0
                 
-                # Muestra progreso
-                print(f"      Costo: {solucion.costo_total:>8.0f}, "
-                      f"Vehículos: {solucion.numero_vehiculos_usados:>3d}, "
-                      f"Tiempo: {solucion.tiempo_construccion:>6.3f}s")
+                encabezado = f"  [{i+1:3d}/{total}] {nombre_instancia}"
+                en_curso.append((instancia, clave, futuro, encabezado))
                 
-            except Exception as e:
-                print(f"      ✗ Error: {str(e)}")
-                # Registra el error
-                resultado = self._crear_registro_error(instancia, str(e))
-                self.resultados_experimento.append(resultado)
+                while len(en_curso) > limite_en_curso:
+                    self._procesar_instancia(*en_curso.popleft())
+            
+            while en_curso:
+                self._procesar_instancia(*en_curso.popleft())
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
     
-    def _crear_registro_resultado(self, instancia: MDVSPData, solucion: SolucionMDVSP) -> Dict:
+    def _procesar_instancia(self, instancia: MDVSPData, clave: str,
+                            futuro: Optional[Future], encabezado: str) -> None:
+        """
+        Obtiene y registra el resultado de una instancia.
+        
+        Sin verbose solo se informan los errores, precedidos del encabezado de la instancia.
+        
+        Args:
+            instancia: Instancia a procesar
+            clave: Clave de caché de la instancia
+            futuro: Resolución en curso en el pool de procesos (None = resolver aquí)
+            encabezado: Línea de progreso que identifica la instancia
+        """
+        if self.verbose:
+            print(encabezado)
+        
+        try:
+            resultado = self._obtener_resultado_cache(clave)
+            
+            if resultado is None:
+                if futuro is not None:
+                    resultado = futuro.result()
+                else:
+                    # Ejecuta algoritmo
+                    solucion = self.algoritmo.resolver(instancia)
+                    resultado = self._crear_registro_resultado(instancia, solucion)
+                    
+                    # El registro ya tiene todo lo necesario: las rutas se reutilizan en la siguiente
+                    solucion.liberar_rutas()
+                
+                self._guardar_resultado_cache(clave, resultado)
+            
+            # Guarda resultado
+            self._registrar_resultado(resultado)
+            
+            # Muestra progreso
+            if self.verbose:
+                print(f"      Costo: {resultado.costo_total:>8.0f}, "
+                      f"Vehículos: {resultado.vehiculos_usados:>3d}, "
+                      f"Tiempo: {resultado.tiempo_construccion:>6.3f}s")
+            
+        except Exception as e:
+            if not self.verbose:
+                print(encabezado)
+            print(f"      ✗ Error: {str(e)}")
+            # Registra el error
+            resultado = self._crear_registro_error(instancia, str(e))
+            self._registrar_resultado(resultado)
+    
+    def _clave_instancia(self, instancia: MDVSPData) -> str:
+        """
+        Calcula la clave de caché de una instancia a partir de su contenido.
+        
+        Args:
+            instancia: Instancia a identificar
+            
+        Returns:
+            Resumen hexadecimal (BLAKE2b) de nombre, matriz, tiempos y flota
+        """
+        resumen = hashlib.blake2b(digest_size=16)
+        resumen.update(f"{VERSION_CACHE_RESULTADOS}|{instancia.nombre_archivo_instancia}".encode())
+        resumen.update(np.ascontiguousarray(instancia.matriz_viajes))
+        resumen.update(np.ascontiguousarray(instancia.tiempos_inicio))
+        resumen.update(np.ascontiguousarray(instancia.tiempos_fin))
+        resumen.update(np.array([deposito.numero_vehiculos for deposito in instancia.depositos],
+                                dtype=np.int64))
+        
+        return resumen.hexdigest()
+    
+    def _obtener_resultado_cache(self, clave: str) -> Optional[ResultadoInstancia]:
+        """
+        Busca el registro de una instancia en la caché en memoria y, si existe, en disco.
+        
+        Args:
+            clave: Clave de caché de la instancia
+            
+        Returns:
+            Registro guardado o None si la instancia no se ha resuelto antes
+        """
+        resultado = self._cache_resultados.get(clave)
+        
+        if resultado is None and self.directorio_cache is not None:
+            archivo_cache = self.directorio_cache / f"{clave}.json"
+            if archivo_cache.exists():
+                try:
+                    with open(archivo_cache, 'r', encoding='utf-8') as archivo:
+                        resultado = ResultadoInstancia(**json.load(archivo))
+                except (OSError, ValueError, TypeError):
+                    # Registro ilegible o de otro formato: la instancia se vuelve a resolver
+                    return None
+                self._cache_resultados[clave] = resultado
+        
+        return resultado
+    
+    def _guardar_resultado_cache(self, clave: str, resultado: ResultadoInstancia) -> None:
+        """
+        Guarda el registro de una instancia resuelta en la caché.
+        
+        Args:
+            clave: Clave de caché de la instancia
+            resultado: Registro de la instancia
+        """
+        self._cache_resultados[clave] = resultado
+        
+        if self.directorio_cache is not None:
+            archivo_cache = self.directorio_cache / f"{clave}.json"
+            archivo_temporal = archivo_cache.with_name(f"{archivo_cache.name}.{os.getpid()}.tmp")
+            
+            # Se escribe en un archivo temporal para que una interrupción no deje un registro a medias
+            with open(archivo_temporal, 'w', encoding='utf-8') as archivo:
+                json.dump(asdict(resultado), archivo)
+            os.replace(archivo_temporal, archivo_cache)
+    
+    @staticmethod
+    def _crear_registro_resultado(instancia: MDVSPData, solucion: SolucionMDVSP) -> ResultadoInstancia:
         """
         Crea un registro de resultado para una instancia resuelta.
         
@@ -132,30 +427,29 @@ class ExperimentRunner:
             solucion: Solución obtenida
             
         Returns:
-            Diccionario con datos del resultado
+            Resultado de la instancia
         """
         estadisticas = solucion.obtener_estadisticas()
         
-        return {
-            'instancia': instancia.nombre_archivo_instancia,
-            'numero_depositos': instancia.numero_depositos,
-            'numero_viajes': instancia.numero_viajes,
-            'vehiculos_disponibles': instancia.numero_total_vehiculos,
-            'costo_total': solucion.costo_total,
-            'vehiculos_usados': solucion.numero_vehiculos_usados,
-            'viajes_asignados': len(solucion.viajes_asignados),
-            'tiempo_construccion': solucion.tiempo_construccion,
-            'es_factible': solucion.es_factible,
-            'rutas_activas': estadisticas['numero_rutas_activas'],
-            'viajes_por_ruta_promedio': estadisticas['viajes_por_ruta_promedio'],
-            'viajes_por_ruta_max': estadisticas['viajes_por_ruta_max'],
-            'viajes_por_ruta_min': estadisticas['viajes_por_ruta_min'],
-            'costo_por_vehiculo': estadisticas['costo_por_vehiculo_promedio'],
-            'utilizacion_vehiculos': estadisticas['utilizacion_vehiculos'],
-            'error': None
-        }
+        return ResultadoInstancia(
+            instancia=instancia.nombre_archivo_instancia,
+            numero_depositos=instancia.numero_depositos,
+            numero_viajes=instancia.numero_viajes,
+            vehiculos_disponibles=instancia.numero_total_vehiculos,
+            costo_total=solucion.costo_total,
+            vehiculos_usados=solucion.numero_vehiculos_usados,
+            viajes_asignados=solucion.contar_viajes_asignados(),
+            tiempo_construccion=solucion.tiempo_construccion,
+            es_factible=solucion.es_factible,
+            rutas_activas=estadisticas['numero_rutas_activas'],
+            viajes_por_ruta_promedio=estadisticas['viajes_por_ruta_promedio'],
+            viajes_por_ruta_max=estadisticas['viajes_por_ruta_max'],
+            viajes_por_ruta_min=estadisticas['viajes_por_ruta_min'],
+            costo_por_vehiculo=estadisticas['costo_por_vehiculo_promedio'],
+            utilizacion_vehiculos=estadisticas['utilizacion_vehiculos']
+        )
     
-    def _crear_registro_error(self, instancia: MDVSPData, mensaje_error: str) -> Dict:
+    def _crear_registro_error(self, instancia: MDVSPData, mensaje_error: str) -> ResultadoInstancia:
         """
         Crea un registro de error para una instancia no resuelta.
         
@@ -164,26 +458,15 @@ class ExperimentRunner:
             mensaje_error: Descripción del error
             
         Returns:
-            Diccionario con datos del error
+            Resultado con los datos de la instancia y el error
         """
-        return {
-            'instancia': instancia.nombre_archivo_instancia,
-            'numero_depositos': instancia.numero_depositos,
-            'numero_viajes': instancia.numero_viajes,
-            'vehiculos_disponibles': instancia.numero_total_vehiculos,
-            'costo_total': None,
-            'vehiculos_usados': None,
-            'viajes_asignados': None,
-            'tiempo_construccion': None,
-            'es_factible': False,
-            'rutas_activas': None,
-            'viajes_por_ruta_promedio': None,
-            'viajes_por_ruta_max': None,
-            'viajes_por_ruta_min': None,
-            'costo_por_vehiculo': None,
-            'utilizacion_vehiculos': None,
-            'error': mensaje_error
-        }
+        return ResultadoInstancia(
+            instancia=instancia.nombre_archivo_instancia,
+            numero_depositos=instancia.numero_depositos,
+            numero_viajes=instancia.numero_viajes,
+            vehiculos_disponibles=instancia.numero_total_vehiculos,
+            error=mensaje_error
+        )
     
     def _generar_reportes(self) -> Dict:
         """
@@ -192,15 +475,11 @@ class ExperimentRunner:
         Returns:
             Diccionario con resumen del experimento
         """
-        # Filtra resultados exitosos
-        resultados_exitosos = [r for r in self.resultados_experimento if r['error'] is None]
-        resultados_fallidos = [r for r in self.resultados_experimento if r['error'] is not None]
-        
         # Genera archivo CSV con resultados detallados
         self._guardar_resultados_csv()
         
         # Calcula estadísticas agregadas
-        resumen = self._calcular_estadisticas_agregadas(resultados_exitosos, resultados_fallidos)
+        resumen = self._calcular_estadisticas_agregadas(self._mascara_exitosos())
         
         # Genera reporte textual
         self._generar_reporte_textual(resumen)
@@ -210,73 +489,76 @@ class ExperimentRunner:
         
         return resumen
     
-    def _guardar_resultados_csv(self) -> None:
-        """Guarda los resultados detallados en archivo CSV."""
+    def _abrir_resultados_csv(self) -> None:
+        """Abre el CSV de resultados detallados y escribe su cabecera."""
         archivo_csv = self.directorio_resultados / "resultados_detallados.csv"
         
-        if not self.resultados_experimento:
+        # Búfer de 1 MiB: las filas se vuelcan en pocos bloques grandes, sin flush por fila
+        self._archivo_csv = open(archivo_csv, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._escritor_csv = csv.writer(self._archivo_csv)
+        self._escritor_csv.writerow(COLUMNAS_RESULTADO)
+    
+    def _guardar_resultados_csv(self) -> None:
+        """Cierra el CSV de resultados detallados, que se escribe durante la ejecución."""
+        if self._archivo_csv is None:
             return
         
-        # Obtiene todas las columnas
-        columnas = list(self.resultados_experimento[0].keys())
-        
-        with open(archivo_csv, 'w', newline='', encoding='utf-8') as archivo:
-            escritor = csv.DictWriter(archivo, fieldnames=columnas)
-            escritor.writeheader()
-            escritor.writerows(self.resultados_experimento)
+        nombre_archivo = self._archivo_csv.name
+        self._cerrar_resultados_csv()
+        print(f"  ✓ Resultados detallados guardados en: {nombre_archivo}")
+    
+    def _cerrar_resultados_csv(self) -> None:
+        """Cierra el CSV de resultados detallados si sigue abierto."""
+        if self._archivo_csv is None:
+            return
         
-        print(f"  ✓ Resultados detallados guardados en: {archivo_csv}")
+        self._archivo_csv.close()
+        self._archivo_csv = None
+        self._escritor_csv = None
     
-    def _calcular_estadisticas_agregadas(self, resultados_exitosos: List[Dict], 
-                                       resultados_fallidos: List[Dict]) -> Dict:
+    def _calcular_estadisticas_agregadas(self, exitosos: np.ndarray) -> Dict:
         """
         Calcula estadísticas agregadas del experimento.
         
         Args:
-            resultados_exitosos: Lista de resultados sin errores
-            resultados_fallidos: Lista de resultados con errores
+            exitosos: Máscara booleana de resultados sin errores
             
         Returns:
             Diccionario con estadísticas agregadas
         """
-        if not resultados_exitosos:
+        numero_exitosos = int(exitosos.sum())
+        
+        if not numero_exitosos:
             return {
-                'total_instancias': len(self.resultados_experimento),
+                'total_instancias': self.numero_resultados,
                 'instancias_exitosas': 0,
-                'instancias_fallidas': len(resultados_fallidos),
+                'instancias_fallidas': self.numero_resultados,
                 'tasa_exito': 0.0,
                 'tiempo_total': self.tiempo_total_experimento
             }
         
-        # Estadísticas de costo
-        costos = [r['costo_total'] for r in resultados_exitosos]
-        
-        # Estadísticas de vehículos
-        vehiculos_usados = [r['vehiculos_usados'] for r in resultados_exitosos]
-        vehiculos_disponibles = [r['vehiculos_disponibles'] for r in resultados_exitosos]
-        
-        # Estadísticas de tiempo
-        tiempos = [r['tiempo_construccion'] for r in resultados_exitosos]
-        
-        # Estadísticas de utilización
-        utilizaciones = [r['utilizacion_vehiculos'] for r in resultados_exitosos]
+        # Columnas restringidas a las instancias resueltas
+        columnas = {columna: valores[:self.numero_resultados][exitosos]
+                    for columna, valores in self.resultados_experimento.items()}
+        costos = columnas['costo_total']
+        tiempos = columnas['tiempo_construccion']
         
         return {
-            'total_instancias': len(self.resultados_experimento),
-            'instancias_exitosas': len(resultados_exitosos),
-            'instancias_fallidas': len(resultados_fallidos),
-            'tasa_exito': (len(resultados_exitosos) / len(self.resultados_experimento)) * 100,
+            'total_instancias': self.numero_resultados,
+            'instancias_exitosas': numero_exitosos,
+            'instancias_fallidas': self.numero_resultados - numero_exitosos,
+            'tasa_exito': (numero_exitosos / self.numero_resultados) * 100,
             'tiempo_total': self.tiempo_total_experimento,
-            'tiempo_promedio_instancia': sum(tiempos) / len(tiempos),
-            'tiempo_min': min(tiempos),
-            'tiempo_max': max(tiempos),
-            'costo_promedio': sum(costos) / len(costos),
-            'costo_min': min(costos),
-            'costo_max': max(costos),
-            'vehiculos_promedio': sum(vehiculos_usados) / len(vehiculos_usados),
-            'vehiculos_disponibles_promedio': sum(vehiculos_disponibles) / len(vehiculos_disponibles),
-            'utilizacion_promedio': sum(utilizaciones) / len(utilizaciones),
-            'todas_factibles': all(r['es_factible'] for r in resultados_exitosos)
+            'tiempo_promedio_instancia': float(tiempos.mean()),
+            'tiempo_min': float(tiempos.min()),
+            'tiempo_max': float(tiempos.max()),
+            'costo_promedio': float(costos.mean()),
+            'costo_min': float(costos.min()),
+            'costo_max': float(costos.max()),
+            'vehiculos_promedio': float(columnas['vehiculos_usados'].mean()),
+            'vehiculos_disponibles_promedio': float(columnas['vehiculos_disponibles'].mean()),
+            'utilizacion_promedio': float(columnas['utilizacion_vehiculos'].mean()),
+            'todas_factibles': bool(columnas['es_factible'].all())
         }
     
     def _generar_reporte_textual(self, resumen: Dict) -> None:
@@ -288,37 +570,45 @@ class ExperimentRunner:
         """
         archivo_reporte = self.directorio_resultados / "reporte_experimento.txt"
         
+        lineas = [
+            "REPORTE DEL EXPERIMENTO - ALGORITMO CONCURRENT SCHEDULE",
+            "=" * 60,
+            "",
+            f"Fecha y hora: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Algoritmo: Concurrent Schedule (Constructivo)",
+            f"Total instancias procesadas: {resumen['total_instancias']}",
+            "",
+            "RESULTADOS GENERALES:",
+            "-" * 30,
+            f"Instancias exitosas: {resumen['instancias_exitosas']}",
+            f"Instancias fallidas: {resumen['instancias_fallidas']}",
+            f"Tasa de éxito: {resumen['tasa_exito']:.1f}%",
+            f"Tiempo total: {resumen['tiempo_total']:.2f}s",
+            ""
+        ]
+        
+        if resumen['instancias_exitosas'] > 0:
+            lineas.extend([
+                "ESTADÍSTICAS DE RENDIMIENTO:",
+                "-" * 30,
+                f"Tiempo promedio por instancia: {resumen['tiempo_promedio_instancia']:.4f}s",
+                f"Tiempo mínimo: {resumen['tiempo_min']:.4f}s",
+                f"Tiempo máximo: {resumen['tiempo_max']:.4f}s",
+                "",
+                "ESTADÍSTICAS DE CALIDAD:",
+                "-" * 30,
+                f"Costo promedio: {resumen['costo_promedio']:.0f}",
+                f"Costo mínimo: {resumen['costo_min']:.0f}",
+                f"Costo máximo: {resumen['costo_max']:.0f}",
+                f"Vehículos usados (promedio): {resumen['vehiculos_promedio']:.1f}",
+                f"Vehículos disponibles (promedio): {resumen['vehiculos_disponibles_promedio']:.1f}",
+                f"Utilización promedio: {resumen['utilizacion_promedio']:.1f}%",
+                f"Todas las soluciones factibles: {'Sí' if resumen['todas_factibles'] else 'No'}"
+            ])
+        
+        # El reporte completo se arma en memoria y se escribe con una sola llamada
         with open(archivo_reporte, 'w', encoding='utf-8') as archivo:
-            archivo.write("REPORTE DEL EXPERIMENTO - ALGORITMO CONCURRENT SCHEDULE\n")
-            archivo.write("=" * 60 + "\n\n")
-            
-            archivo.write(f"Fecha y hora: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            archivo.write(f"Algoritmo: Concurrent Schedule (Constructivo)\n")
-            archivo.write(f"Total instancias procesadas: {resumen['total_instancias']}\n\n")
-            
-            archivo.write("RESULTADOS GENERALES:\n")
-            archivo.write("-" * 30 + "\n")
-            archivo.write(f"Instancias exitosas: {resumen['instancias_exitosas']}\n")
-            archivo.write(f"Instancias fallidas: {resumen['instancias_fallidas']}\n")
-            archivo.write(f"Tasa de éxito: {resumen['tasa_exito']:.1f}%\n")
-            archivo.write(f"Tiempo total: {resumen['tiempo_total']:.2f}s\n\n")
-            
-            if resumen['instancias_exitosas'] > 0:
-                archivo.write("ESTADÍSTICAS DE RENDIMIENTO:\n")
-                archivo.write("-" * 30 + "\n")
-                archivo.write(f"Tiempo promedio por instancia: {resumen['tiempo_promedio_instancia']:.4f}s\n")
-                archivo.write(f"Tiempo mínimo: {resumen['tiempo_min']:.4f}s\n")
-                archivo.write(f"Tiempo máximo: {resumen['tiempo_max']:.4f}s\n\n")
-                
-                archivo.write("ESTADÍSTICAS DE CALIDAD:\n")
-                archivo.write("-" * 30 + "\n")
-                archivo.write(f"Costo promedio: {resumen['costo_promedio']:.0f}\n")
-                archivo.write(f"Costo mínimo: {resumen['costo_min']:.0f}\n")
-                archivo.write(f"Costo máximo: {resumen['costo_max']:.0f}\n")
-                archivo.write(f"Vehículos usados (promedio): {resumen['vehiculos_promedio']:.1f}\n")
-                archivo.write(f"Vehículos disponibles (promedio): {resumen['vehiculos_disponibles_promedio']:.1f}\n")
-                archivo.write(f"Utilización promedio: {resumen['utilizacion_promedio']:.1f}%\n")
-                archivo.write(f"Todas las soluciones factibles: {'Sí' if resumen['todas_factibles'] else 'No'}\n")
+            archivo.write("\n".join(lineas) + "\n")
         
         print(f"  ✓ Reporte textual guardado en: {archivo_reporte}")
     
@@ -341,7 +631,7 @@ class ExperimentRunner:
             print(f"  - Vehículos promedio: {resumen['vehiculos_promedio']:.1f}")
             print(f"  - Utilización promedio: {resumen['utilizacion_promedio']:.1f}%")
     
-    def obtener_mejores_resultados(self, criterio: str = 'costo', top: int = 10) -> List[Dict]:
+    def obtener_mejores_resultados(self, criterio: str = 'costo', top: int = 10) -> List[ResultadoInstancia]:
         """
         Obtiene los mejores resultados según un criterio específico.
         
@@ -352,26 +642,55 @@ class ExperimentRunner:
         Returns:
             Lista de los mejores resultados
         """
-        resultados_exitosos = [r for r in self.resultados_experimento if r['error'] is None]
-        
-        if not resultados_exitosos:
-            return []
-        
-        # Define función de ordenamiento según criterio
+        # Define columna de ordenamiento según criterio
         if criterio == 'costo':
-            key_func = lambda x: x['costo_total']
+            columna = 'costo_total'
             reverso = False
         elif criterio == 'vehiculos':
-            key_func = lambda x: x['vehiculos_usados']
+            columna = 'vehiculos_usados'
             reverso = False
         elif criterio == 'tiempo':
-            key_func = lambda x: x['tiempo_construccion']
+            columna = 'tiempo_construccion'
             reverso = False
         elif criterio == 'utilizacion':
-            key_func = lambda x: x['utilizacion_vehiculos']
+            columna = 'utilizacion_vehiculos'
             reverso = True
         else:
             raise ValueError(f"Criterio no válido: {criterio}")
         
-        resultados_ordenados = sorted(resultados_exitosos, key=key_func, reverse=reverso)
-        return resultados_ordenados[:top]
\ No newline at end of file
+        filas_exitosas = np.flatnonzero(self._mascara_exitosos())
+        
+        if not filas_exitosas.size:
+            return []
+        
+        # Clave ascendente; el descendente se invierte para conservar el orden original en empates
+        valores = self.resultados_experimento[columna][filas_exitosas]
+        claves = -valores if reverso else valores
+        
+        # Selección O(N): solo se ordenan los valores hasta el top-ésimo (incluidos sus empates)
+        candidatas = np.arange(claves.size)
+        if 0 < top < claves.size:
+            umbral = np.partition(claves, top - 1)[top - 1]
+            candidatas = np.flatnonzero(claves <= umbral)
+        
+        orden = candidatas[np.argsort(claves[candidatas], kind='stable')]
+        return [self._obtener_registro(fila) for fila in filas_exitosas[orden[:top]]]
+
+
+def _resolver_instancia(instancia: MDVSPData) -> ResultadoInstancia:
+    """
+    Resuelve una instancia en un proceso del pool y devuelve su registro de resultado.
+    
+    Es una función de módulo para que el pool pueda enviarla a otros procesos.
+    
+    Args:
+        instancia: Instancia a resolver
+        
+    Returns:
+        Resultado de la instancia
+    """
+    solucion = ConcurrentScheduleAlgorithm(verbose=False).resolver(instancia)
+    resultado = ExperimentRunner._crear_registro_resultado(instancia, solucion)
+    solucion.liberar_rutas()
+    
+    return resultado
\ No newline at end of file
@@ -3,22 +3,58 @@ Modelos de solución para el problema MDVSP.
 Define las estructuras para representar rutas de vehículos y soluciones completas.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import ClassVar, Iterable, List, Optional
 import time
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Ruta:
     """Representa una ruta asignada a un vehículo específico."""
     
     id_vehiculo: int
     id_deposito: int
-    viajes: List[int] = field(default_factory=list)
+    viajes: array = field(default_factory=lambda: array('i'))  # IDs de viaje como int C (4 bytes)
     costo_total: float = 0.0
     tiempo_inicio: Optional[int] = None
     tiempo_fin: Optional[int] = None
     
+    # Rutas liberadas por soluciones ya procesadas, disponibles para reutilizarse
+    _rutas_libres: ClassVar[List['Ruta']] = []
+    
+    @classmethod
+    def adquirir(cls, id_vehiculo: int, id_deposito: int) -> 'Ruta':
+        """
+        Obtiene una ruta vacía, reutilizando una liberada si hay disponibles.
+        
+        La lista de rutas libres es compartida por todo el proceso, así que varios hilos
+        pueden tomar rutas de ella a la vez.
+        
+        Args:
+            id_vehiculo: Identificador del vehículo
+            id_deposito: Identificador del depósito de origen
+            
+        Returns:
+            Ruta vacía asignada al vehículo
+        """
+        # pop() es atómico: comprobar antes si la lista está vacía dejaría que dos hilos
+        # se disputaran la última ruta
+        try:
+            ruta = cls._rutas_libres.pop()
+        except IndexError:
+            return cls(id_vehiculo=id_vehiculo, id_deposito=id_deposito)
+        
+        ruta.id_vehiculo = id_vehiculo
+        ruta.id_deposito = id_deposito
+        del ruta.viajes[:]
+        ruta.costo_total = 0.0
+        ruta.tiempo_inicio = None
+        ruta.tiempo_fin = None
+        
+        return ruta
+    
     def agregar_viaje(self, id_viaje: int, costo_adicional: float, 
                      tiempo_inicio_viaje: int, tiempo_fin_viaje: int) -> None:
         """
@@ -41,7 +77,7 @@ class Ruta:
     
     def es_vacia(self) -> bool:
         """Verifica si la ruta está vacía."""
-        return len(self.viajes) == 0
+        return not self.viajes
     
     def numero_viajes(self) -> int:
         """Retorna el número de viajes en la ruta."""
@@ -58,11 +94,11 @@ class Ruta:
             return f"Ruta vacía (Vehículo {self.id_vehiculo}, Depósito {self.id_deposito})"
         
         return (f"Vehículo {self.id_vehiculo} (Dep. {self.id_deposito}): "
-               f"{self.numero_viajes()} viajes, Costo: {self.costo_total:.0f}, "
+               f"{len(self.viajes)} viajes, Costo: {self.costo_total:.0f}, "
                f"Tiempo: [{self.tiempo_inicio}-{self.tiempo_fin}]")
 
 
-@dataclass
+@dataclass(slots=True)
 class SolucionMDVSP:
     """
     Representa una solución completa del problema MDVSP.
@@ -71,12 +107,21 @@ class SolucionMDVSP:
     
     nombre_instancia: str
     rutas: List[Ruta] = field(default_factory=list)
-    viajes_asignados: Set[int] = field(default_factory=set)
+    viajes_asignados: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))  # máscara por ID
     costo_total: float = 0.0
     numero_vehiculos_usados: int = 0
     tiempo_construccion: float = 0.0
     es_factible: bool = False
     
+    # Resultados memorizados de obtener_rutas_activas / obtener_estadisticas
+    _rutas_activas_cache: Optional[List[Ruta]] = field(default=None, init=False, repr=False, compare=False)
+    _estadisticas_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _invalidar_cache(self) -> None:
+        """Descarta los resultados memorizados tras un cambio en las rutas."""
+        self._rutas_activas_cache = None
+        self._estadisticas_cache = None
+    
     def agregar_ruta(self, ruta: Ruta) -> None:
         """
         Agrega una ruta a la solución.
@@ -85,11 +130,50 @@ class SolucionMDVSP:
             ruta: Ruta a agregar
         """
         self.rutas.append(ruta)
+        self._invalidar_cache()
         
-        if not ruta.es_vacia():
+        if ruta.viajes:
             self.numero_vehiculos_usados += 1
             self.costo_total += ruta.costo_total
-            self.viajes_asignados.update(ruta.viajes)
+            self.marcar_viajes_asignados(ruta.viajes)
+    
+    def marcar_viajes_asignados(self, viajes: Iterable[int]) -> None:
+        """
+        Marca viajes como asignados en la máscara, ampliándola si hace falta.
+        
+        Args:
+            viajes: IDs de los viajes asignados
+        """
+        ids = np.asarray(viajes, dtype=np.intp)
+        if not ids.size:
+            return
+        
+        maximo = int(ids.max())
+        if maximo >= self.viajes_asignados.size:
+            ampliada = np.zeros(maximo + 1, dtype=bool)
+            ampliada[:self.viajes_asignados.size] = self.viajes_asignados
+            self.viajes_asignados = ampliada
+        
+        self.viajes_asignados[ids] = True
+    
+    def contar_viajes_asignados(self) -> int:
+        """
+        Cuenta los viajes marcados como asignados.
+        
+        Returns:
+            Número de viajes asignados
+        """
+        return int(np.count_nonzero(self.viajes_asignados))
+    
+    def liberar_rutas(self) -> None:
+        """
+        Devuelve las rutas de la solución para que Ruta.adquirir las reutilice.
+        
+        La solución queda sin rutas; solo debe llamarse cuando ya no se necesiten.
+        """
+        Ruta._rutas_libres.extend(self.rutas)
+        self.rutas = []
+        self._invalidar_cache()
     
     def calcular_metricas(self, numero_total_viajes: int) -> None:
         """
@@ -98,21 +182,30 @@ class SolucionMDVSP:
         Args:
             numero_total_viajes: Número total de viajes en la instancia
         """
+        # Las rutas pueden haberse completado después de agregarse
+        self._invalidar_cache()
+        
         # Recalcula totales
         self.costo_total = sum(ruta.costo_total for ruta in self.rutas)
-        self.numero_vehiculos_usados = sum(1 for ruta in self.rutas if not ruta.es_vacia())
+        self.numero_vehiculos_usados = sum(1 for ruta in self.rutas if ruta.viajes)
         
         # Verifica factibilidad
-        self.es_factible = len(self.viajes_asignados) == numero_total_viajes
+        self.es_factible = self.contar_viajes_asignados() == numero_total_viajes
     
     def obtener_rutas_activas(self) -> List[Ruta]:
         """
         Obtiene solo las rutas que tienen viajes asignados.
         
+        El resultado se memoriza hasta el siguiente cambio de rutas (agregar_ruta,
+        calcular_metricas o liberar_rutas).
+        
         Returns:
             Lista de rutas no vacías
         """
-        return [ruta for ruta in self.rutas if not ruta.es_vacia()]
+        if self._rutas_activas_cache is None:
+            self._rutas_activas_cache = [ruta for ruta in self.rutas if ruta.viajes]
+        
+        return self._rutas_activas_cache
     
     def obtener_gap(self, mejor_conocido: Optional[float] = None) -> Optional[float]:
         """
@@ -133,6 +226,20 @@ class SolucionMDVSP:
         """
         Calcula estadísticas detalladas de la solución.
         
+        El resultado se memoriza igual que obtener_rutas_activas.
+        
+        Returns:
+            Diccionario con estadísticas
+        """
+        if self._estadisticas_cache is None:
+            self._estadisticas_cache = self._calcular_estadisticas()
+        
+        return self._estadisticas_cache
+    
+    def _calcular_estadisticas(self) -> dict:
+        """
+        Calcula las estadísticas de la solución sin usar la memoria.
+        
         Returns:
             Diccionario con estadísticas
         """
@@ -148,16 +255,29 @@ class SolucionMDVSP:
                 'utilizacion_vehiculos': 0
             }
         
-        viajes_por_ruta = [ruta.numero_viajes() for ruta in rutas_activas]
-        costos_por_ruta = [ruta.costo_total for ruta in rutas_activas]
+        # Una sola pasada acumulando suma, mínimo y máximo
+        total_viajes = 0
+        viajes_max = 0
+        viajes_min = len(rutas_activas[0].viajes)
+        costo_acumulado = 0
+        for ruta in rutas_activas:
+            numero_viajes = len(ruta.viajes)
+            total_viajes += numero_viajes
+            if numero_viajes > viajes_max:
+                viajes_max = numero_viajes
+            if numero_viajes < viajes_min:
+                viajes_min = numero_viajes
+            costo_acumulado += ruta.costo_total
+        
+        numero_rutas_activas = len(rutas_activas)
         
         return {
-            'numero_rutas_activas': len(rutas_activas),
-            'viajes_por_ruta_promedio': sum(viajes_por_ruta) / len(viajes_por_ruta),
-            'viajes_por_ruta_max': max(viajes_por_ruta),
-            'viajes_por_ruta_min': min(viajes_por_ruta),
-            'costo_por_vehiculo_promedio': sum(costos_por_ruta) / len(costos_por_ruta),
-            'utilizacion_vehiculos': (len(rutas_activas) / len(self.rutas)) * 100.0
+            'numero_rutas_activas': numero_rutas_activas,
+            'viajes_por_ruta_promedio': total_viajes / numero_rutas_activas,
+            'viajes_por_ruta_max': viajes_max,
+            'viajes_por_ruta_min': viajes_min,
+            'costo_por_vehiculo_promedio': costo_acumulado / numero_rutas_activas,
+            'utilizacion_vehiculos': (numero_rutas_activas / len(self.rutas)) * 100.0
         }
     
     def obtener_resumen(self) -> str:
@@ -174,7 +294,7 @@ class SolucionMDVSP:
             f"Factible: {'✓ Sí' if self.es_factible else '✗ No'}",
             f"Costo Total: {self.costo_total:.0f}",
             f"Vehículos Usados: {self.numero_vehiculos_usados} / {len(self.rutas)}",
-            f"Viajes Asignados: {len(self.viajes_asignados)}",
+            f"Viajes Asignados: {self.contar_viajes_asignados()}",
             f"Tiempo Construcción: {self.tiempo_construccion:.4f}s",
             "",
             f"Estadísticas:",
@@ -210,9 +330,9 @@ class SolucionMDVSP:
         for i, ruta in enumerate(rutas_ordenadas[:mostrar_max]):
             detalle.append(f"  {i+1:2d}. {ruta.obtener_resumen()}")
             if len(ruta.viajes) <= 10:
-                detalle.append(f"      Viajes: {ruta.viajes}")
+                detalle.append(f"      Viajes: {ruta.viajes.tolist()}")
             else:
-                detalle.append(f"      Viajes: {ruta.viajes[:5]} ... {ruta.viajes[-5:]}")
+                detalle.append(f"      Viajes: {ruta.viajes[:5].tolist()} ... {ruta.viajes[-5:].tolist()}")
         
         if len(rutas_ordenadas) > mostrar_max:
             detalle.append(f"  ... y {len(rutas_ordenadas) - mostrar_max} rutas más")
@@ -3,23 +3,155 @@ Algoritmo constructivo optimizado para el problema VSP (Vehicle Scheduling Probl
 Implementa una heurística greedy que minimiza el número de vehículos y el costo total.
 """
 
+from array import array
 import time
-from typing import List, Tuple, Optional
-from memory_profiler import profile
+from typing import Dict, Tuple, Optional
 import numpy as np
+from numba import njit
 
-from data.vsp_data_model import VSPData, Servicio
+from data._cargador_comun import crear_pool_procesos
+from data.vsp_data_model import VSPData
 from algorithms.vsp_solution_model import SolucionVSP, RutaVSP
 
 
+# Centinela de "sin solución todavía" al comparar costos y criterios
+_INF = float('inf')
+
+# Firmas explícitas de los kernels: se compilan al importar el módulo (y se guardan en caché)
+# en vez de en la primera llamada. La matriz de puntuación es int32 o float64 (ver
+# VSPData._construir_matriz_puntuacion) y los costos de depósito comparten su tipo.
+_FIRMAS_INSERCION_RUTA = [
+    f"Tuple((int64, float64))({tipo}[:, :], int32[:], {tipo}[:], int64, int64, int64[:], int64, boolean[:, :])"
+    for tipo in ("int32", "float64")
+]
+_FIRMAS_MEJOR_ASIGNACION = [
+    f"Tuple((int64, int64, float64))({tipo}[:, :], int32[:, :], int32[:], {tipo}[:, :], int64, int64, "
+    f"int64, int64[:], int64, boolean[:, :])"
+    for tipo in ("int32", "float64")
+]
+
+
+@njit(_FIRMAS_INSERCION_RUTA, cache=True)
+def _mejor_insercion_ruta(matriz: np.ndarray, servicios_ruta: np.ndarray, costos_deposito: np.ndarray,
+                          id_servicio: int, inicio_servicio: int, tiempos_fin: np.ndarray,
+                          indice_deposito: int, conexiones_factibles: np.ndarray) -> Tuple[int, float]:
+    """
+    Busca la posición de menor costo incremental para insertar un servicio en una ruta no vacía.
+    
+    Toda conexión factible respeta la precedencia temporal, así que los servicios de una ruta
+    están ordenados en el tiempo. La única posición que puede ser factible es la que sigue
+    a los servicios que terminan antes de que empiece el nuevo: se localiza con una búsqueda
+    binaria y solo esa se evalúa.
+    
+    Args:
+        matriz: Matriz de puntuación de la instancia (servicios + depósito)
+        servicios_ruta: Servicios de la ruta en orden
+        costos_deposito: Costos depósito -> primer servicio y último servicio -> depósito de la ruta
+        id_servicio: ID del servicio a insertar
+        inicio_servicio: Tiempo de inicio del servicio a insertar
+        tiempos_fin: Tiempos de fin de todos los servicios
+        indice_deposito: Índice del depósito en la matriz
+        conexiones_factibles: Matriz booleana de conexiones factibles (servicios + depósito)
+        
+    Returns:
+        Tupla (posicion, costo_incremental); posición -1 si no hay inserción factible
+    """
+    n_ruta = servicios_ruta.shape[0]
+    
+    # Primera posición cuyo servicio no ha terminado al empezar el nuevo
+    desde = 0
+    hasta = n_ruta
+    while desde < hasta:
+        medio = (desde + hasta) // 2
+        if tiempos_fin[servicios_ruta[medio]] <= inicio_servicio:
+            desde = medio + 1
+        else:
+            hasta = medio
+    posicion = desde
+    
+    anterior = servicios_ruta[posicion - 1] if posicion > 0 else indice_deposito
+    siguiente = servicios_ruta[posicion] if posicion < n_ruta else indice_deposito
+    
+    # Una sola consulta por tramo cubre costo infactible y precedencia temporal; ambas se
+    # combinan sin cortocircuito en un único salto. El tramo anterior -> siguiente ya
+    # pertenece a la ruta, así que se validó al insertarlo.
+    if not (conexiones_factibles[anterior, id_servicio] & conexiones_factibles[id_servicio, siguiente]):
+        return -1, np.inf
+    
+    # Costo nuevo: anterior -> servicio -> siguiente; costo original: anterior -> siguiente
+    # (en los extremos es un tramo con el depósito, guardado por ruta)
+    if posicion == 0:
+        costo_original = costos_deposito[0]
+    elif posicion == n_ruta:
+        costo_original = costos_deposito[1]
+    else:
+        costo_original = matriz[anterior, siguiente]
+    
+    return posicion, matriz[anterior, id_servicio] + matriz[id_servicio, siguiente] - costo_original
+
+
+@njit(_FIRMAS_MEJOR_ASIGNACION, cache=True)
+def _mejor_asignacion_kernel(matriz: np.ndarray, servicios_rutas: np.ndarray, longitudes: np.ndarray,
+                             costos_deposito_rutas: np.ndarray, numero_rutas: int, id_servicio: int,
+                             inicio_servicio: int, tiempos_fin: np.ndarray, indice_deposito: int,
+                             conexiones_factibles: np.ndarray) -> Tuple[int, int, float]:
+    """
+    Busca la mejor inserción de un servicio entre todas las rutas en una sola pasada.
+    
+    Cada ruta se crea con su primer servicio, así que ninguna está vacía. Es un argmin
+    del costo incremental sobre las rutas en el que una inserción infactible puntúa
+    infinito; los empates se resuelven a favor de la primera ruta (cada ruta admite a lo
+    sumo una posición).
+    
+    Args:
+        matriz: Matriz de puntuación de la instancia (servicios + depósito)
+        servicios_rutas: Buffers de secuencias de servicios por ruta
+        longitudes: Número de servicios de cada ruta
+        costos_deposito_rutas: Costos depósito -> primer servicio y último servicio -> depósito por ruta
+        numero_rutas: Número de rutas creadas
+        id_servicio: ID del servicio a insertar
+        inicio_servicio: Tiempo de inicio del servicio a insertar
+        tiempos_fin: Tiempos de fin de todos los servicios
+        indice_deposito: Índice del depósito en la matriz
+        conexiones_factibles: Matriz booleana de conexiones factibles (servicios + depósito)
+        
+    Returns:
+        Tupla (id_ruta, posicion, costo_incremental); ruta -1 si no hay inserción factible
+    """
+    mejor_ruta = -1
+    mejor_posicion = -1
+    mejor_costo = np.inf
+    
+    for id_ruta in range(numero_rutas):
+        n_ruta = longitudes[id_ruta]
+        posicion, costo = _mejor_insercion_ruta(matriz, servicios_rutas[id_ruta, :n_ruta],
+                                                costos_deposito_rutas[id_ruta], id_servicio,
+                                                inicio_servicio, tiempos_fin, indice_deposito,
+                                                conexiones_factibles)
+        
+        # Una inserción infactible cuesta infinito y nunca mejora a mejor_costo
+        if costo < mejor_costo:
+            mejor_costo = costo
+            mejor_ruta = id_ruta
+            mejor_posicion = posicion
+    
+    return mejor_ruta, mejor_posicion, mejor_costo
+
+
 class VSPConstructiveAlgorithm:
     """
     Algoritmo constructivo para VSP basado en estrategia greedy con múltiples criterios.
     Prioriza minimizar vehículos usados y luego minimizar costo total.
     """
     
-    def __init__(self) -> None:
-        """Inicializa el algoritmo constructivo VSP."""
+    def __init__(self, verbose: bool = True) -> None:
+        """
+        Inicializa el algoritmo constructivo VSP.
+        
+        Args:
+            verbose: Si debe mostrar el encabezado y los resultados de cada ejecución
+        """
+        self.verbose = verbose
         self.estadisticas = {
             'servicios_procesados': 0,
             'rutas_creadas': 0,
@@ -27,7 +159,6 @@ class VSPConstructiveAlgorithm:
             'evaluaciones_factibilidad': 0
         }
     
-    @profile
     def resolver(self, instancia: VSPData, estrategia: str = "tiempo_inicio") -> SolucionVSP:
         """
         Resuelve una instancia VSP usando el algoritmo constructivo.
@@ -41,25 +172,57 @@ class VSPConstructiveAlgorithm:
         """
         inicio_tiempo = time.perf_counter()
         
-        print(f"=== Iniciando VSP Constructivo ===")
-        print(f"Instancia: {instancia.nombre_instancia}")
-        print(f"Servicios: {instancia.numero_servicios}")
-        print(f"Vehículos disponibles: {instancia.deposito.numero_vehiculos}")
-        print(f"Estrategia: {estrategia}")
+        if self.verbose:
+            print(f"=== Iniciando VSP Constructivo ===")
+            print(f"Instancia: {instancia.nombre_instancia}")
+            print(f"Servicios: {instancia.numero_servicios}")
+            print(f"Vehículos disponibles: {instancia.deposito.numero_vehiculos}")
+            print(f"Estrategia: {estrategia}")
         
         # Reinicia estadísticas
         self._reiniciar_estadisticas()
         
         # Crea solución vacía
-        solucion = SolucionVSP(nombre_instancia=instancia.nombre_instancia)
+        solucion = SolucionVSP(
+            nombre_instancia=instancia.nombre_instancia,
+            servicios_asignados=np.zeros(instancia.numero_servicios, dtype=bool)
+        )
+        
+        # Secuencias de servicios por ruta (una fila por ruta) para evaluar todas las rutas a la vez;
+        # cada ruta tiene al menos un servicio, así que no puede haber más rutas que servicios
+        numero_rutas_max = min(instancia.deposito.numero_vehiculos, instancia.numero_servicios)
+        servicios_rutas = np.empty((numero_rutas_max, instancia.numero_servicios), dtype=np.int32)
+        longitudes = np.zeros(numero_rutas_max, dtype=np.int32)
+        
+        # Tramos con el depósito de cada ruta (salida al primer servicio, regreso desde el último),
+        # que solo cambian al insertar en un extremo
+        costos_deposito_rutas = np.zeros((numero_rutas_max, 2), dtype=instancia.matriz_puntuacion.dtype)
         
         # Ordena servicios según estrategia
         servicios_ordenados = self._ordenar_servicios(instancia, estrategia)
         
-        # Procesa cada servicio
-        for id_servicio in servicios_ordenados:
-            self._procesar_servicio(instancia, solucion, id_servicio)
-            self.estadisticas['servicios_procesados'] += 1
+        # Procesa cada servicio (método resuelto una vez fuera del ciclo); los contadores son
+        # locales y se vuelcan a las estadísticas al terminar
+        procesar_servicio = self._procesar_servicio
+        rutas = solucion.rutas
+        servicios_procesados = 0
+        evaluaciones_factibilidad = 0
+        for id_servicio in servicios_ordenados.tolist():
+            # Cada ruta evalúa una posición más que servicios tiene; todos los servicios ya
+            # procesados están asignados a alguna ruta
+            evaluaciones_factibilidad += servicios_procesados + len(rutas)
+            procesar_servicio(instancia, solucion, id_servicio, servicios_rutas, longitudes,
+                              costos_deposito_rutas)
+            servicios_procesados += 1
+        
+        # Cada servicio procesado abrió una ruta o se insertó en una existente
+        self.estadisticas['servicios_procesados'] = servicios_procesados
+        self.estadisticas['rutas_creadas'] = len(rutas)
+        self.estadisticas['insercciones_realizadas'] = servicios_procesados - len(rutas)
+        self.estadisticas['evaluaciones_factibilidad'] = evaluaciones_factibilidad
+        
+        # Vuelca los buffers en las rutas de la solución
+        self._materializar_rutas(instancia, solucion, servicios_rutas, longitudes)
         
         # Calcula métricas finales
         tiempo_total = time.perf_counter() - inicio_tiempo
@@ -67,49 +230,93 @@ class VSPConstructiveAlgorithm:
         solucion.calcular_metricas(instancia.numero_servicios)
         
         # Imprime resultados
-        self._imprimir_resultados(solucion, tiempo_total)
+        if self.verbose:
+            self._imprimir_resultados(solucion, tiempo_total)
         
         return solucion
     
+    def _materializar_rutas(self, instancia: VSPData, solucion: SolucionVSP,
+                            servicios_rutas: np.ndarray, longitudes: np.ndarray) -> None:
+        """
+        Copia las secuencias de los buffers a las rutas y calcula sus ventanas temporales.
+        
+        Durante la construcción las secuencias solo viven en los buffers preasignados, así
+        que cada inserción es un desplazamiento dentro de un arreglo int32 contiguo.
+        
+        Args:
+            instancia: Instancia VSP
+            solucion: Solución construida
+            servicios_rutas: Buffers de secuencias de servicios por ruta
+            longitudes: Número de servicios de cada ruta
+        """
+        for id_ruta, ruta in enumerate(solucion.rutas):
+            servicios = servicios_rutas[id_ruta, :longitudes[id_ruta]]
+            
+            # Los bytes int32 del buffer son directamente los del array('i') de la ruta
+            ruta.establecer_servicios(array('i', servicios.tobytes()),
+                                      int(instancia.tiempos_inicio[servicios].min()),
+                                      int(instancia.tiempos_fin[servicios].max()))
+    
     def _reiniciar_estadisticas(self) -> None:
         """Reinicia las estadísticas del algoritmo."""
         for clave in self.estadisticas:
             self.estadisticas[clave] = 0
     
-    def _ordenar_servicios(self, instancia: VSPData, estrategia: str) -> List[int]:
+    def _ordenar_servicios(self, instancia: VSPData, estrategia: str) -> np.ndarray:
         """
         Ordena los servicios según la estrategia especificada.
         
+        El orden se calcula una vez por instancia y estrategia y se reutiliza en las
+        siguientes ejecuciones (por ejemplo, al probar múltiples estrategias).
+        
         Args:
             instancia: Instancia VSP
             estrategia: Estrategia de ordenamiento
             
         Returns:
-            Lista de IDs de servicios ordenados
+            Arreglo de IDs de servicios ordenados
         """
-        servicios = instancia.servicios
+        orden = instancia.ordenes_servicios.get(estrategia)
         
+        if orden is None:
+            orden = self._calcular_orden_servicios(instancia, estrategia)
+            instancia.ordenes_servicios[estrategia] = orden
+        
+        return orden
+    
+    def _calcular_orden_servicios(self, instancia: VSPData, estrategia: str) -> np.ndarray:
+        """
+        Calcula el orden de los servicios para una estrategia con ordenamientos estables.
+        
+        Args:
+            instancia: Instancia VSP
+            estrategia: Estrategia de ordenamiento
+            
+        Returns:
+            Arreglo de IDs de servicios ordenados
+        """
         if estrategia == "tiempo_inicio":
             # Ordena por tiempo de inicio (Earliest Start Time First)
-            return sorted(range(len(servicios)), key=lambda i: servicios[i].tiempo_inicio)
+            return np.argsort(instancia.tiempos_inicio, kind='stable')
         
         elif estrategia == "tiempo_fin":
             # Ordena por tiempo de fin (Earliest Finish Time First)
-            return sorted(range(len(servicios)), key=lambda i: servicios[i].tiempo_fin)
+            return np.argsort(instancia.tiempos_fin, kind='stable')
         
         elif estrategia == "duracion":
             # Ordena por duración (Shortest Processing Time First)
-            return sorted(range(len(servicios)), key=lambda i: servicios[i].duracion())
+            return np.argsort(instancia.duraciones, kind='stable')
         
         elif estrategia == "mixta":
-            # Estrategia mixta: tiempo inicio + duración
-            return sorted(range(len(servicios)), 
-                         key=lambda i: (servicios[i].tiempo_inicio, servicios[i].duracion()))
+            # Estrategia mixta: tiempo inicio + duración (lexsort usa la última clave como principal)
+            return np.lexsort((instancia.duraciones, instancia.tiempos_inicio))
         
         else:
             raise ValueError(f"Estrategia desconocida: {estrategia}")
     
-    def _procesar_servicio(self, instancia: VSPData, solucion: SolucionVSP, id_servicio: int) -> None:
+    def _procesar_servicio(self, instancia: VSPData, solucion: SolucionVSP, id_servicio: int,
+                           servicios_rutas: np.ndarray, longitudes: np.ndarray,
+                           costos_deposito_rutas: np.ndarray) -> None:
         """
         Procesa un servicio individual intentando asignarlo a la mejor ruta disponible.
         
@@ -117,220 +324,32 @@ class VSPConstructiveAlgorithm:
             instancia: Instancia VSP
             solucion: Solución en construcción
             id_servicio: ID del servicio a procesar
+            servicios_rutas: Buffers de secuencias de servicios por ruta
+            longitudes: Número de servicios de cada ruta
+            costos_deposito_rutas: Costos de los tramos con el depósito de cada ruta
         """
-        servicio = instancia.servicios[id_servicio]
-        
-        # Busca la mejor opción de asignación entre rutas existentes
-        mejor_opcion = self._encontrar_mejor_asignacion(instancia, solucion, id_servicio)
+        # Busca la mejor opción de asignación entre rutas existentes (id_ruta -1 si no hay)
+        id_ruta, posicion, costo_incremental = _mejor_asignacion_kernel(
+            instancia.matriz_puntuacion, servicios_rutas, longitudes, costos_deposito_rutas,
+            len(solucion.rutas), id_servicio, instancia.tiempos_inicio[id_servicio], instancia.tiempos_fin,
+            instancia.numero_servicios, instancia.conexiones_factibles
+        )
         
-        if mejor_opcion is not None:
+        if id_ruta >= 0:
             # Asigna a ruta existente
-            id_ruta, posicion, costo_incremental = mejor_opcion
-            self._asignar_a_ruta_existente(instancia, solucion, id_servicio, id_ruta, posicion, costo_incremental)
-            self.estadisticas['insercciones_realizadas'] += 1
+            self._asignar_a_ruta_existente(instancia, solucion, id_servicio, id_ruta, posicion,
+                                           costo_incremental, servicios_rutas, longitudes,
+                                           costos_deposito_rutas)
         
         else:
             # Crea nueva ruta
-            self._crear_nueva_ruta(instancia, solucion, id_servicio)
-            self.estadisticas['rutas_creadas'] += 1
-    
-    def _encontrar_mejor_asignacion(self, instancia: VSPData, solucion: SolucionVSP, 
-                                   id_servicio: int) -> Optional[Tuple[int, int, float]]:
-        """
-        Encuentra la mejor asignación para un servicio entre rutas existentes.
-        
-        Args:
-            instancia: Instancia VSP
-            solucion: Solución actual
-            id_servicio: ID del servicio a asignar
-            
-        Returns:
-            Tuple (id_ruta, posicion, costo_incremental) o None si no es factible
-        """
-        mejor_opcion = None
-        mejor_costo = float('inf')
-        
-        # Evalúa cada ruta existente
-        for i, ruta in enumerate(solucion.rutas):
-            if ruta.es_vacia():
-                continue
-            
-            # Encuentra la mejor posición en esta ruta
-            opcion_ruta = self._evaluar_insercion_en_ruta(instancia, ruta, id_servicio)
-            
-            if opcion_ruta is not None:
-                posicion, costo_incremental = opcion_ruta
-                
-                # Aplica criterio de selección: minimiza costo incremental
-                if costo_incremental < mejor_costo:
-                    mejor_costo = costo_incremental
-                    mejor_opcion = (i, posicion, costo_incremental)
-        
-        return mejor_opcion
-    
-    def _evaluar_insercion_en_ruta(self, instancia: VSPData, ruta: RutaVSP, 
-                                  id_servicio: int) -> Optional[Tuple[int, float]]:
-        """
-        Evalúa las posibles inserciones de un servicio en una ruta específica.
-        
-        Args:
-            instancia: Instancia VSP
-            ruta: Ruta donde evaluar la inserción
-            id_servicio: ID del servicio a insertar
-            
-        Returns:
-            Tuple (mejor_posicion, costo_incremental) o None si no es factible
-        """
-        servicio = instancia.servicios[id_servicio]
-        mejor_posicion = None
-        mejor_costo = float('inf')
-        
-        # Evalúa inserción en cada posición posible
-        for posicion in range(len(ruta.servicios) + 1):
-            costo_incremental = self._calcular_costo_insercion(instancia, ruta, id_servicio, posicion)
-            self.estadisticas['evaluaciones_factibilidad'] += 1
-            
-            if costo_incremental is not None and costo_incremental < mejor_costo:
-                # Verifica factibilidad temporal de la inserción
-                if self._es_insercion_factible(instancia, ruta, id_servicio, posicion):
-                    mejor_costo = costo_incremental
-                    mejor_posicion = posicion
-        
-        return (mejor_posicion, mejor_costo) if mejor_posicion is not None else None
-    
-    def _calcular_costo_insercion(self, instancia: VSPData, ruta: RutaVSP, 
-                                 id_servicio: int, posicion: int) -> Optional[float]:
-        """
-        Calcula el costo incremental de insertar un servicio en una posición específica.
-        
-        Args:
-            instancia: Instancia VSP
-            ruta: Ruta donde insertar
-            id_servicio: ID del servicio a insertar
-            posicion: Posición de inserción (0 = al inicio)
-            
-        Returns:
-            Costo incremental o None si no es factible
-        """
-        if posicion < 0 or posicion > len(ruta.servicios):
-            return None
-        
-        # Caso: inserción al final de la ruta
-        if posicion == len(ruta.servicios):
-            return self._calcular_costo_insercion_final(instancia, ruta, id_servicio)
-        
-        # Caso: inserción al inicio de la ruta  
-        elif posicion == 0:
-            return self._calcular_costo_insercion_inicio(instancia, ruta, id_servicio)
-        
-        # Caso: inserción en el medio de la ruta
-        else:
-            return self._calcular_costo_insercion_medio(instancia, ruta, id_servicio, posicion)
-    
-    def _calcular_costo_insercion_final(self, instancia: VSPData, ruta: RutaVSP, 
-                                       id_servicio: int) -> Optional[float]:
-        """Calcula costo de inserción al final de una ruta."""
-        if ruta.es_vacia():
-            # Ruta vacía: depósito -> servicio -> depósito
-            costo_ida = instancia.obtener_costo_desde_deposito(id_servicio)
-            costo_vuelta = instancia.obtener_costo_hacia_deposito(id_servicio)
-            
-            if (costo_ida >= instancia.COSTO_INFACTIBLE or 
-                costo_vuelta >= instancia.COSTO_INFACTIBLE):
-                return None
-            
-            return costo_ida + costo_vuelta
-        
-        else:
-            # Inserción después del último servicio
-            ultimo_servicio = ruta.obtener_ultimo_servicio()
-            
-            # Costo original: último_servicio -> depósito
-            costo_original = instancia.obtener_costo_hacia_deposito(ultimo_servicio)
-            
-            # Costo nuevo: último_servicio -> nuevo_servicio -> depósito
-            costo_conexion = instancia.obtener_costo_conexion(ultimo_servicio, id_servicio)
-            costo_regreso = instancia.obtener_costo_hacia_deposito(id_servicio)
-            
-            if (costo_conexion >= instancia.COSTO_INFACTIBLE or 
-                costo_regreso >= instancia.COSTO_INFACTIBLE or
-                costo_original >= instancia.COSTO_INFACTIBLE):
-                return None
-            
-            return costo_conexion + costo_regreso - costo_original
-    
-    def _calcular_costo_insercion_inicio(self, instancia: VSPData, ruta: RutaVSP, 
-                                        id_servicio: int) -> Optional[float]:
-        """Calcula costo de inserción al inicio de una ruta."""
-        primer_servicio = ruta.obtener_primer_servicio()
-        
-        # Costo original: depósito -> primer_servicio
-        costo_original = instancia.obtener_costo_desde_deposito(primer_servicio)
-        
-        # Costo nuevo: depósito -> nuevo_servicio -> primer_servicio
-        costo_ida = instancia.obtener_costo_desde_deposito(id_servicio)
-        costo_conexion = instancia.obtener_costo_conexion(id_servicio, primer_servicio)
-        
-        if (costo_ida >= instancia.COSTO_INFACTIBLE or 
-            costo_conexion >= instancia.COSTO_INFACTIBLE or
-            costo_original >= instancia.COSTO_INFACTIBLE):
-            return None
-        
-        return costo_ida + costo_conexion - costo_original
-    
-    def _calcular_costo_insercion_medio(self, instancia: VSPData, ruta: RutaVSP, 
-                                       id_servicio: int, posicion: int) -> Optional[float]:
-        """Calcula costo de inserción en el medio de una ruta."""
-        servicio_anterior = ruta.servicios[posicion - 1]
-        servicio_siguiente = ruta.servicios[posicion]
-        
-        # Costo original: servicio_anterior -> servicio_siguiente
-        costo_original = instancia.obtener_costo_conexion(servicio_anterior, servicio_siguiente)
-        
-        # Costo nuevo: servicio_anterior -> nuevo_servicio -> servicio_siguiente
-        costo_entrada = instancia.obtener_costo_conexion(servicio_anterior, id_servicio)
-        costo_salida = instancia.obtener_costo_conexion(id_servicio, servicio_siguiente)
-        
-        if (costo_entrada >= instancia.COSTO_INFACTIBLE or 
-            costo_salida >= instancia.COSTO_INFACTIBLE or
-            costo_original >= instancia.COSTO_INFACTIBLE):
-            return None
-        
-        return costo_entrada + costo_salida - costo_original
-    
-    def _es_insercion_factible(self, instancia: VSPData, ruta: RutaVSP, 
-                              id_servicio: int, posicion: int) -> bool:
-        """
-        Verifica si la inserción de un servicio en una posición es temporalmente factible.
-        
-        Args:
-            instancia: Instancia VSP
-            ruta: Ruta donde insertar
-            id_servicio: ID del servicio a insertar
-            posicion: Posición de inserción
-            
-        Returns:
-            True si la inserción es factible
-        """
-        servicio = instancia.servicios[id_servicio]
-        
-        # Verifica con servicio anterior (si existe)
-        if posicion > 0:
-            servicio_anterior = ruta.servicios[posicion - 1]
-            if not instancia.es_conexion_factible(servicio_anterior, id_servicio):
-                return False
-        
-        # Verifica con servicio siguiente (si existe)
-        if posicion < len(ruta.servicios):
-            servicio_siguiente = ruta.servicios[posicion]
-            if not instancia.es_conexion_factible(id_servicio, servicio_siguiente):
-                return False
-        
-        return True
+            self._crear_nueva_ruta(instancia, solucion, id_servicio, servicios_rutas, longitudes,
+                                   costos_deposito_rutas)
     
     def _asignar_a_ruta_existente(self, instancia: VSPData, solucion: SolucionVSP, 
                                  id_servicio: int, id_ruta: int, posicion: int, 
-                                 costo_incremental: float) -> None:
+                                 costo_incremental: float, servicios_rutas: np.ndarray,
+                                 longitudes: np.ndarray, costos_deposito_rutas: np.ndarray) -> None:
         """
         Asigna un servicio a una ruta existente en la posición especificada.
         
@@ -341,24 +360,35 @@ class VSPConstructiveAlgorithm:
             id_ruta: ID de la ruta destino
             posicion: Posición de inserción
             costo_incremental: Costo incremental de la asignación
+            servicios_rutas: Buffers de secuencias de servicios por ruta
+            longitudes: Número de servicios de cada ruta
+            costos_deposito_rutas: Costos de los tramos con el depósito de cada ruta
         """
-        ruta = solucion.rutas[id_ruta]
-        servicio = instancia.servicios[id_servicio]
-        
-        # Inserta el servicio en la ruta
-        ruta.insertar_servicio(
-            posicion=posicion,
-            id_servicio=id_servicio,
-            incremento_costo=costo_incremental,
-            tiempo_inicio_servicio=servicio.tiempo_inicio,
-            tiempo_fin_servicio=servicio.tiempo_fin
-        )
+        # Inserta el servicio en el buffer de la ruta desplazando su cola una posición; la
+        # secuencia de la RutaVSP se materializa al terminar la construcción
+        n_ruta = longitudes[id_ruta]
+        buffer_ruta = servicios_rutas[id_ruta]
+        buffer_ruta[posicion + 1:n_ruta + 1] = buffer_ruta[posicion:n_ruta]
+        buffer_ruta[posicion] = id_servicio
+        longitudes[id_ruta] = n_ruta + 1
+        
+        # Un servicio insertado en un extremo pasa a ser el tramo con el depósito
+        if posicion == 0 or posicion == n_ruta:
+            matriz = instancia.matriz_puntuacion
+            indice_deposito = instancia.numero_servicios
+            if posicion == 0:
+                costos_deposito_rutas[id_ruta, 0] = matriz[indice_deposito, id_servicio]
+            if posicion == n_ruta:
+                costos_deposito_rutas[id_ruta, 1] = matriz[id_servicio, indice_deposito]
         
         # Actualiza la solución
-        solucion.servicios_asignados.add(id_servicio)
+        solucion.rutas[id_ruta].costo_total += costo_incremental
+        solucion.servicios_asignados[id_servicio] = True
         solucion.costo_total += costo_incremental
     
-    def _crear_nueva_ruta(self, instancia: VSPData, solucion: SolucionVSP, id_servicio: int) -> None:
+    def _crear_nueva_ruta(self, instancia: VSPData, solucion: SolucionVSP, id_servicio: int,
+                          servicios_rutas: np.ndarray, longitudes: np.ndarray,
+                          costos_deposito_rutas: np.ndarray) -> None:
         """
         Crea una nueva ruta con el servicio dado.
         
@@ -366,37 +396,38 @@ class VSPConstructiveAlgorithm:
             instancia: Instancia VSP
             solucion: Solución en construcción
             id_servicio: ID del servicio para la nueva ruta
+            servicios_rutas: Buffers de secuencias de servicios por ruta
+            longitudes: Número de servicios de cada ruta
+            costos_deposito_rutas: Costos de los tramos con el depósito de cada ruta
         """
         # Verifica que haya vehículos disponibles
         if len(solucion.rutas) >= instancia.deposito.numero_vehiculos:
             raise RuntimeError(f"No hay vehículos disponibles para nueva ruta (servicio {id_servicio})")
         
-        # Crea nueva ruta
         id_vehiculo = len(solucion.rutas)
-        nueva_ruta = RutaVSP(id_vehiculo=id_vehiculo)
         
-        # Calcula costo de la nueva ruta: depósito -> servicio -> depósito
-        costo_ida = instancia.obtener_costo_desde_deposito(id_servicio)
-        costo_vuelta = instancia.obtener_costo_hacia_deposito(id_servicio)
+        # Calcula costo de la nueva ruta: depósito -> servicio -> depósito. Se lee directamente
+        # de la matriz (el ID ya es válido) y los mismos tramos inicializan la ruta en los buffers
+        matriz = instancia.matriz_puntuacion
+        indice_deposito = instancia.numero_servicios
+        costo_ida = matriz[indice_deposito, id_servicio]
+        costo_vuelta = matriz[id_servicio, indice_deposito]
         
-        if (costo_ida >= instancia.COSTO_INFACTIBLE or 
-            costo_vuelta >= instancia.COSTO_INFACTIBLE):
+        if max(costo_ida, costo_vuelta) >= instancia.COSTO_INFACTIBLE:
             raise RuntimeError(f"Servicio {id_servicio} no puede conectarse con depósito")
         
-        costo_total_ruta = costo_ida + costo_vuelta
-        servicio = instancia.servicios[id_servicio]
+        costo_total_ruta = float(costo_ida + costo_vuelta)
         
-        # Agrega el servicio a la nueva ruta
-        nueva_ruta.agregar_servicio(
-            id_servicio=id_servicio,
-            costo_adicional=costo_total_ruta,
-            tiempo_inicio_servicio=servicio.tiempo_inicio,
-            tiempo_fin_servicio=servicio.tiempo_fin
-        )
+        # Crea la ruta con su costo; servicios y ventana temporal se materializan al terminar
+        nueva_ruta = RutaVSP(id_vehiculo=id_vehiculo, costo_total=costo_total_ruta)
         
         # Agrega la ruta a la solución
+        servicios_rutas[id_vehiculo, 0] = id_servicio
+        longitudes[id_vehiculo] = 1
+        costos_deposito_rutas[id_vehiculo, 0] = costo_ida
+        costos_deposito_rutas[id_vehiculo, 1] = costo_vuelta
         solucion.rutas.append(nueva_ruta)
-        solucion.servicios_asignados.add(id_servicio)
+        solucion.servicios_asignados[id_servicio] = True
         solucion.costo_total += costo_total_ruta
     
     def _imprimir_resultados(self, solucion: SolucionVSP, tiempo_total: float) -> None:
@@ -410,7 +441,7 @@ class VSPConstructiveAlgorithm:
         print(f"\n=== Resultados VSP Constructivo ===")
         print(f"Factible: {'Sí' if solucion.es_factible else 'No'}")
         print(f"Vehículos usados: {solucion.numero_vehiculos_usados}")
-        print(f"Servicios asignados: {len(solucion.servicios_asignados)}")
+        print(f"Servicios asignados: {solucion.contar_servicios_asignados()}")
         print(f"Costo total: {solucion.costo_total:.0f}")
         print(f"Makespan: {solucion.makespan}")
         print(f"Tiempo construcción: {tiempo_total:.4f}s")
@@ -424,44 +455,88 @@ class VSPConstructiveAlgorithm:
         for i, ruta in enumerate(solucion.obtener_rutas_activas()):
             print(f"Ruta {i}: {ruta.obtener_resumen()}")
     
-    def resolver_con_multiples_estrategias(self, instancia: VSPData) -> SolucionVSP:
+    def resolver_con_multiples_estrategias(self, instancia: VSPData,
+                                           procesos: Optional[int] = 1) -> SolucionVSP:
         """
         Resuelve la instancia con múltiples estrategias y retorna la mejor solución.
         
+        Las estrategias son independientes, así que con varios procesos se resuelven en
+        paralelo; la mejor se elige en el orden de las estrategias, igual que en secuencial.
+        Cada estrategia se resuelve sin mostrar resultados; solo se informan los errores y,
+        con verbose, la solución ganadora.
+        
+        El paralelismo es opcional: cada llamada con varios procesos arranca un pool nuevo,
+        y cada proceso tarda segundos en importar numpy/numba y recibir la instancia, así
+        que solo compensa cuando cada estrategia tarda bastante más que eso en resolverse.
+        
         Args:
             instancia: Instancia VSP a resolver
+            procesos: Número de procesos para resolver las estrategias en paralelo
+                (1 = secuencial en el proceso actual, por defecto; None = uno por CPU)
             
         Returns:
             Mejor solución encontrada entre todas las estrategias
         """
         estrategias = ["tiempo_inicio", "tiempo_fin", "duracion", "mixta"]
         mejor_solucion = None
-        mejor_costo = float('inf')
-        
-        print(f"=== Ejecutando Múltiples Estrategias ===")
-        
-        for estrategia in estrategias:
-            print(f"\n--- Estrategia: {estrategia} ---")
+        mejor_estrategia = None
+        mejor_costo = _INF
+        
+        if self.verbose:
+            print(f"=== Ejecutando Múltiples Estrategias ===")
+        
+        ejecutor = crear_pool_procesos(procesos, len(estrategias))
+        try:
+            futuros = None
+            if ejecutor is not None:
+                futuros = [ejecutor.submit(_resolver_estrategia, instancia, estrategia)
+                           for estrategia in estrategias]
             
-            try:
-                solucion = self.resolver(instancia, estrategia)
-                
-                # Evalúa la solución (prioriza vehículos, luego costo)
-                criterio_evaluacion = (solucion.numero_vehiculos_usados, solucion.costo_total)
-                criterio_mejor = (mejor_solucion.numero_vehiculos_usados, mejor_solucion.costo_total) if mejor_solucion else (float('inf'), float('inf'))
-                
-                if criterio_evaluacion < criterio_mejor:
-                    mejor_solucion = solucion
-                    mejor_costo = solucion.costo_total
-                    print(f"✓ Nueva mejor solución encontrada!")
-                
-            except Exception as e:
-                print(f"✗ Error con estrategia {estrategia}: {e}")
-        
-        if mejor_solucion:
+            for i, estrategia in enumerate(estrategias):
+                try:
+                    if futuros is None:
+                        solucion, self.estadisticas = _resolver_estrategia(instancia, estrategia)
+                    else:
+                        solucion, self.estadisticas = futuros[i].result()
+                    
+                    # Evalúa la solución (prioriza vehículos, luego costo)
+                    criterio_evaluacion = (solucion.numero_vehiculos_usados, solucion.costo_total)
+                    criterio_mejor = (mejor_solucion.numero_vehiculos_usados, mejor_solucion.costo_total) if mejor_solucion else (_INF, _INF)
+                    
+                    if criterio_evaluacion < criterio_mejor:
+                        mejor_solucion = solucion
+                        mejor_estrategia = estrategia
+                        mejor_costo = solucion.costo_total
+                    
+                except Exception as e:
+                    print(f"✗ Error con estrategia {estrategia}: {e}")
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
+        
+        if mejor_solucion and self.verbose:
             print(f"\n=== Mejor Solución Final ===")
-            print(f"Estrategia ganadora: {estrategias[0]}")  # Simplificado
+            print(f"Estrategia ganadora: {mejor_estrategia}")
             print(f"Vehículos: {mejor_solucion.numero_vehiculos_usados}")
             print(f"Costo: {mejor_solucion.costo_total:.0f}")
         
-        return mejor_solucion
\ No newline at end of file
+        return mejor_solucion
+
+
+def _resolver_estrategia(instancia: VSPData, estrategia: str) -> Tuple[SolucionVSP, Dict[str, int]]:
+    """
+    Resuelve una estrategia sin mostrar resultados, en un proceso del pool o en el actual.
+    
+    Es una función de módulo para que el pool pueda enviarla a otros procesos.
+    
+    Args:
+        instancia: Instancia VSP a resolver
+        estrategia: Estrategia de ordenamiento
+        
+    Returns:
+        Tupla (solución, estadísticas del algoritmo)
+    """
+    algoritmo = VSPConstructiveAlgorithm(verbose=False)
+    solucion = algoritmo.resolver(instancia, estrategia)
+    
+    return solucion, algoritmo.estadisticas
\ No newline at end of file
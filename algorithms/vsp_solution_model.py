@@ -3,21 +3,28 @@ Modelos de solución para el problema VSP (Vehicle Scheduling Problem).
 Define las estructuras para representar rutas de vehículos y soluciones completas VSP.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
+import math
 import time
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class RutaVSP:
     """Representa una ruta de vehículo en el problema VSP."""
     
     id_vehiculo: int
-    servicios: List[int] = field(default_factory=list)
+    servicios: array = field(default_factory=lambda: array('i'))  # IDs de servicio como int C (4 bytes)
     costo_total: float = 0.0
     tiempo_inicio_ruta: Optional[int] = None
     tiempo_fin_ruta: Optional[int] = None
     
+    # Conjunto de servicios para contiene_servicio: se construye en la primera consulta y luego
+    # se actualiza en cada agregar/insertar (None = aún no construido)
+    _servicios_set: Optional[Set[int]] = field(default=None, init=False, repr=False, compare=False)
+    
     def agregar_servicio(self, id_servicio: int, costo_adicional: float,
                         tiempo_inicio_servicio: int, tiempo_fin_servicio: int) -> None:
         """
@@ -30,6 +37,8 @@ class RutaVSP:
             tiempo_fin_servicio: Tiempo de fin del servicio
         """
         self.servicios.append(id_servicio)
+        if self._servicios_set is not None:
+            self._servicios_set.add(id_servicio)
         self.costo_total += costo_adicional
         
         # Actualiza ventana temporal de la ruta
@@ -51,6 +60,8 @@ class RutaVSP:
             tiempo_fin_servicio: Tiempo de fin del servicio
         """
         self.servicios.insert(posicion, id_servicio)
+        if self._servicios_set is not None:
+            self._servicios_set.add(id_servicio)
         self.costo_total += incremento_costo
         
         # Actualiza ventana temporal si es necesario
@@ -59,6 +70,21 @@ class RutaVSP:
         if self.tiempo_fin_ruta is None or tiempo_fin_servicio > self.tiempo_fin_ruta:
             self.tiempo_fin_ruta = tiempo_fin_servicio
     
+    def establecer_servicios(self, servicios: array, tiempo_inicio_ruta: int,
+                             tiempo_fin_ruta: int) -> None:
+        """
+        Reemplaza la secuencia completa de servicios de la ruta y su ventana temporal.
+        
+        Args:
+            servicios: Secuencia de IDs de servicio en orden
+            tiempo_inicio_ruta: Tiempo de inicio del primer servicio de la ruta
+            tiempo_fin_ruta: Tiempo de fin del último servicio de la ruta
+        """
+        self.servicios = servicios
+        self.tiempo_inicio_ruta = tiempo_inicio_ruta
+        self.tiempo_fin_ruta = tiempo_fin_ruta
+        self._servicios_set = None
+    
     def es_vacia(self) -> bool:
         """Verifica si la ruta está vacía."""
         return len(self.servicios) == 0
@@ -74,9 +100,24 @@ class RutaVSP:
         Returns:
             Duración en unidades de tiempo o 0 si la ruta está vacía
         """
-        if self.es_vacia() or self.tiempo_inicio_ruta is None or self.tiempo_fin_ruta is None:
+        # Lee cada campo una vez; la ventana ya está guardada, así que no hace falta caché
+        inicio = self.tiempo_inicio_ruta
+        fin = self.tiempo_fin_ruta
+        if not self.servicios or inicio is None or fin is None:
             return 0
-        return self.tiempo_fin_ruta - self.tiempo_inicio_ruta
+        return fin - inicio
+    
+    def obtener_arreglo_servicios(self) -> np.ndarray:
+        """
+        Obtiene la secuencia de servicios como arreglo int32 para cálculos vectorizados.
+        
+        Es una copia (un memcpy desde el array('i')), así que la ruta puede seguir
+        modificándose mientras el arreglo esté en uso.
+        
+        Returns:
+            Arreglo con los IDs de servicio de la ruta en orden
+        """
+        return np.array(self.servicios, dtype=np.int32)
     
     def obtener_ultimo_servicio(self) -> Optional[int]:
         """
@@ -106,7 +147,28 @@ class RutaVSP:
         Returns:
             True si la ruta contiene el servicio
         """
-        return id_servicio in self.servicios
+        return id_servicio in self._obtener_conjunto_servicios()
+    
+    def contiene_cualquiera(self, ids_servicios: Set[int]) -> bool:
+        """
+        Verifica si la ruta contiene alguno de los servicios dados en una sola operación.
+        
+        Conviene cuando quien llama ya tiene los IDs en un set o frozenset; construir el
+        conjunto solo para una consulta cuesta más que llamar a contiene_servicio.
+        
+        Args:
+            ids_servicios: IDs de los servicios a buscar
+            
+        Returns:
+            True si la ruta contiene al menos uno de los servicios
+        """
+        return not self._obtener_conjunto_servicios().isdisjoint(ids_servicios)
+    
+    def _obtener_conjunto_servicios(self) -> Set[int]:
+        """Obtiene el conjunto de servicios de la ruta, construyéndolo en la primera consulta."""
+        if self._servicios_set is None:
+            self._servicios_set = set(self.servicios)
+        return self._servicios_set
     
     def obtener_resumen(self) -> str:
         """
@@ -124,7 +186,7 @@ class RutaVSP:
                f"Duración: {self.duracion_total()}")
 
 
-@dataclass
+@dataclass(slots=True)
 class SolucionVSP:
     """
     Representa una solución completa del problema VSP.
@@ -133,7 +195,7 @@ class SolucionVSP:
     
     nombre_instancia: str
     rutas: List[RutaVSP] = field(default_factory=list)
-    servicios_asignados: Set[int] = field(default_factory=set)
+    servicios_asignados: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))  # máscara por ID
     costo_total: float = 0.0
     numero_vehiculos_usados: int = 0
     tiempo_construccion: float = 0.0
@@ -141,6 +203,7 @@ class SolucionVSP:
     
     # Métricas específicas del VSP
     numero_servicios_total: int = 0
+    numero_servicios_asignados: int = 0  # Mantenido por agregar_ruta y calcular_metricas
     makespan: int = 0  # Tiempo total desde el primer al último servicio
     
     def agregar_ruta(self, ruta: RutaVSP) -> None:
@@ -154,8 +217,63 @@ class SolucionVSP:
         
         if not ruta.es_vacia():
             self.numero_vehiculos_usados += 1
+            self.numero_servicios_asignados += len(ruta.servicios)
             self.costo_total += ruta.costo_total
-            self.servicios_asignados.update(ruta.servicios)
+            self.marcar_servicios_asignados(ruta.servicios)
+    
+    def marcar_servicios_asignados(self, servicios: Iterable[int]) -> None:
+        """
+        Marca servicios como asignados en la máscara, ampliándola si hace falta.
+        
+        Args:
+            servicios: IDs de los servicios asignados
+        """
+        # Un array('i') se lee sin copia ni conversión: los índices int C sirven directamente
+        if isinstance(servicios, array) and servicios.typecode == 'i':
+            ids = np.frombuffer(servicios, dtype=np.intc)
+        else:
+            ids = np.asarray(servicios, dtype=np.intp)
+        
+        if not ids.size:
+            return
+        
+        maximo = int(ids.max())
+        if maximo >= self.servicios_asignados.size:
+            ampliada = np.zeros(maximo + 1, dtype=bool)
+            ampliada[:self.servicios_asignados.size] = self.servicios_asignados
+            self.servicios_asignados = ampliada
+        
+        self.servicios_asignados[ids] = True
+    
+    def filtrar_no_asignados(self, candidatos: Set[int]) -> Set[int]:
+        """
+        Filtra los candidatos que aún no están asignados consultando la máscara en bloque.
+        
+        Conviene cuando quien llama ya tiene los candidatos en un set o frozenset, en vez
+        de consultar la máscara servicio por servicio.
+        
+        Args:
+            candidatos: IDs de servicios candidatos
+            
+        Returns:
+            Conjunto de candidatos no asignados
+        """
+        ids = np.fromiter(candidatos, dtype=np.intp, count=len(candidatos))
+        
+        # Los IDs fuera de la máscara nunca se han marcado como asignados
+        dentro = (ids >= 0) & (ids < self.servicios_asignados.size)
+        no_asignados = ~dentro
+        no_asignados[dentro] = ~self.servicios_asignados[ids[dentro]]
+        return set(ids[no_asignados].tolist())
+    
+    def contar_servicios_asignados(self) -> int:
+        """
+        Cuenta los servicios marcados como asignados.
+        
+        Returns:
+            Número de servicios asignados
+        """
+        return int(np.count_nonzero(self.servicios_asignados))
     
     def crear_nueva_ruta(self, id_vehiculo: int) -> RutaVSP:
         """
@@ -180,34 +298,44 @@ class SolucionVSP:
         """
         self.numero_servicios_total = numero_servicios_instancia
         
-        # Recalcula totales
-        self.costo_total = sum(ruta.costo_total for ruta in self.rutas)
-        self.numero_vehiculos_usados = sum(1 for ruta in self.rutas if not ruta.es_vacia())
+        # Recalcula costo y vehículos en una sola pasada por las rutas. El costo se suma con
+        # math.fsum (redondeo único), así que el total no depende del orden de las rutas ni
+        # arrastra el error de sumas parciales con costos fraccionarios
+        costos_rutas = []
+        vehiculos_usados = 0
+        for ruta in self.rutas:
+            costos_rutas.append(ruta.costo_total)
+            if ruta.servicios:
+                vehiculos_usados += 1
+        
+        self.costo_total = math.fsum(costos_rutas)
+        self.numero_vehiculos_usados = vehiculos_usados
         
-        # Verifica factibilidad (todos los servicios asignados)
-        self.es_factible = len(self.servicios_asignados) == numero_servicios_instancia
+        # Verifica factibilidad (todos los servicios asignados) con un único conteo de la máscara,
+        # que queda guardado para los reportes
+        self.numero_servicios_asignados = self.contar_servicios_asignados()
+        self.es_factible = self.numero_servicios_asignados == numero_servicios_instancia
         
         # Calcula makespan
         self._calcular_makespan()
     
     def _calcular_makespan(self) -> None:
         """Calcula el makespan (tiempo total) de la solución."""
-        if not self.rutas:
+        rutas_con_ventana = [ruta for ruta in self.rutas
+                             if ruta.servicios and ruta.tiempo_inicio_ruta is not None
+                             and ruta.tiempo_fin_ruta is not None]
+        
+        if not rutas_con_ventana:
             self.makespan = 0
             return
         
-        tiempos_inicio = []
-        tiempos_fin = []
-        
-        for ruta in self.rutas:
-            if not ruta.es_vacia() and ruta.tiempo_inicio_ruta is not None and ruta.tiempo_fin_ruta is not None:
-                tiempos_inicio.append(ruta.tiempo_inicio_ruta)
-                tiempos_fin.append(ruta.tiempo_fin_ruta)
-        
-        if tiempos_inicio and tiempos_fin:
-            self.makespan = max(tiempos_fin) - min(tiempos_inicio)
-        else:
-            self.makespan = 0
+        # Reduce las ventanas de todas las rutas con min/max vectorizados
+        numero_rutas = len(rutas_con_ventana)
+        tiempos_inicio = np.fromiter((ruta.tiempo_inicio_ruta for ruta in rutas_con_ventana),
+                                     dtype=np.int64, count=numero_rutas)
+        tiempos_fin = np.fromiter((ruta.tiempo_fin_ruta for ruta in rutas_con_ventana),
+                                  dtype=np.int64, count=numero_rutas)
+        self.makespan = int(tiempos_fin.max() - tiempos_inicio.min())
     
     def obtener_rutas_activas(self) -> List[RutaVSP]:
         """
@@ -216,7 +344,7 @@ class SolucionVSP:
         Returns:
             Lista de rutas no vacías
         """
-        return [ruta for ruta in self.rutas if not ruta.es_vacia()]
+        return [ruta for ruta in self.rutas if ruta.servicios]
     
     def obtener_servicios_no_asignados(self, numero_servicios_total: int) -> Set[int]:
         """
@@ -228,8 +356,12 @@ class SolucionVSP:
         Returns:
             Conjunto de IDs de servicios no asignados
         """
-        todos_los_servicios = set(range(numero_servicios_total))
-        return todos_los_servicios - self.servicios_asignados
+        # Solo se recorren los servicios sin asignar: los huecos de la máscara y los IDs que
+        # quedan más allá de su tamaño (nunca marcados)
+        asignados = self.servicios_asignados[:max(numero_servicios_total, 0)]
+        no_asignados = set(np.flatnonzero(~asignados).tolist())
+        no_asignados.update(range(asignados.size, numero_servicios_total))
+        return no_asignados
     
     def obtener_utilizacion_vehiculos(self, vehiculos_disponibles: int) -> float:
         """
@@ -254,7 +386,7 @@ class SolucionVSP:
         """
         if self.numero_vehiculos_usados <= 0:
             return 0.0
-        return len(self.servicios_asignados) / self.numero_vehiculos_usados
+        return self.numero_servicios_asignados / self.numero_vehiculos_usados
     
     def obtener_gap(self, mejor_conocido: Optional[float] = None) -> Optional[float]:
         """
@@ -284,21 +416,23 @@ class SolucionVSP:
         errores = []
         
         # Verifica que todos los servicios estén asignados
-        if len(self.servicios_asignados) != instancia_vsp.numero_servicios:
+        if self.contar_servicios_asignados() != instancia_vsp.numero_servicios:
             servicios_faltantes = self.obtener_servicios_no_asignados(instancia_vsp.numero_servicios)
             errores.append(f"Servicios no asignados: {servicios_faltantes}")
         
-        # Verifica que no haya servicios duplicados
-        servicios_en_rutas = []
-        for ruta in self.rutas:
-            servicios_en_rutas.extend(ruta.servicios)
+        # Verifica que no haya servicios duplicados: se unen los IDs de todas las rutas en un
+        # único arreglo y se comparan con sus valores distintos. No se usa la máscara de
+        # asignados porque es justo la consistencia que se está validando
+        arreglos_rutas = [ruta.obtener_arreglo_servicios() for ruta in self.rutas]
+        servicios_en_rutas = (np.concatenate(arreglos_rutas) if arreglos_rutas
+                              else np.empty(0, dtype=np.int32))
         
-        if len(servicios_en_rutas) != len(set(servicios_en_rutas)):
+        if np.unique(servicios_en_rutas).size != servicios_en_rutas.size:
             errores.append("Hay servicios duplicados en múltiples rutas")
         
         # Verifica factibilidad de cada ruta
         for i, ruta in enumerate(self.rutas):
-            if ruta.es_vacia():
+            if not ruta.servicios:
                 continue
             
             es_factible, mensaje = instancia_vsp.validar_secuencia_servicios(ruta.servicios)
@@ -331,29 +465,59 @@ class SolucionVSP:
                 'utilizacion_tiempo': 0.0
             }
         
-        servicios_por_ruta = [ruta.numero_servicios() for ruta in rutas_activas]
-        costos_por_ruta = [ruta.costo_total for ruta in rutas_activas]
-        duraciones_por_ruta = [ruta.duracion_total() for ruta in rutas_activas]
+        servicios_asignados = self.numero_servicios_asignados
+        
+        # Una sola pasada acumulando suma, mínimo y máximo de las tres series
+        primera_ruta = rutas_activas[0]
+        servicios_total = 0
+        servicios_min = servicios_max = len(primera_ruta.servicios)
+        costo_acumulado = 0
+        costo_min = costo_max = primera_ruta.costo_total
+        duracion_acumulada = 0
+        duracion_min = duracion_max = primera_ruta.duracion_total()
+        for ruta in rutas_activas:
+            numero_servicios = len(ruta.servicios)
+            servicios_total += numero_servicios
+            if numero_servicios < servicios_min:
+                servicios_min = numero_servicios
+            if numero_servicios > servicios_max:
+                servicios_max = numero_servicios
+            
+            costo = ruta.costo_total
+            costo_acumulado += costo
+            if costo < costo_min:
+                costo_min = costo
+            if costo > costo_max:
+                costo_max = costo
+            
+            duracion = ruta.duracion_total()
+            duracion_acumulada += duracion
+            if duracion < duracion_min:
+                duracion_min = duracion
+            if duracion > duracion_max:
+                duracion_max = duracion
+        
+        numero_rutas_activas = len(rutas_activas)
         
         return {
-            'numero_rutas_activas': len(rutas_activas),
+            'numero_rutas_activas': numero_rutas_activas,
             'servicios_por_ruta': {
-                'promedio': sum(servicios_por_ruta) / len(servicios_por_ruta),
-                'minimo': min(servicios_por_ruta),
-                'maximo': max(servicios_por_ruta)
+                'promedio': servicios_total / numero_rutas_activas,
+                'minimo': servicios_min,
+                'maximo': servicios_max
             },
             'costos_por_ruta': {
-                'promedio': sum(costos_por_ruta) / len(costos_por_ruta),
-                'minimo': min(costos_por_ruta),
-                'maximo': max(costos_por_ruta)
+                'promedio': costo_acumulado / numero_rutas_activas,
+                'minimo': costo_min,
+                'maximo': costo_max
             },
             'duraciones_por_ruta': {
-                'promedio': sum(duraciones_por_ruta) / len(duraciones_por_ruta),
-                'minimo': min(duraciones_por_ruta),
-                'maximo': max(duraciones_por_ruta)
+                'promedio': duracion_acumulada / numero_rutas_activas,
+                'minimo': duracion_min,
+                'maximo': duracion_max
             },
             'eficiencia_promedio': self.obtener_eficiencia_promedio(),
-            'costo_promedio_por_servicio': self.costo_total / len(self.servicios_asignados) if self.servicios_asignados else 0,
+            'costo_promedio_por_servicio': self.costo_total / servicios_asignados if servicios_asignados else 0,
             'makespan': self.makespan
         }
     
@@ -364,19 +528,19 @@ class SolucionVSP:
         Returns:
             String con información resumida de la solución
         """
-        resumen = f"""
-=== Solución VSP: {self.nombre_instancia} ===
-Factible: {'Sí' if self.es_factible else 'No'}
-Vehículos usados: {self.numero_vehiculos_usados}
-Servicios asignados: {len(self.servicios_asignados)} / {self.numero_servicios_total}
-Costo total: {self.costo_total:.0f}
-Makespan: {self.makespan}
-Tiempo construcción: {self.tiempo_construccion:.4f}s
-
-Eficiencia: {self.obtener_eficiencia_promedio():.2f} servicios/vehículo
-        """.strip()
-        
-        return resumen
+        resumen = [
+            f"=== Solución VSP: {self.nombre_instancia} ===",
+            f"Factible: {'Sí' if self.es_factible else 'No'}",
+            f"Vehículos usados: {self.numero_vehiculos_usados}",
+            f"Servicios asignados: {self.numero_servicios_asignados} / {self.numero_servicios_total}",
+            f"Costo total: {self.costo_total:.0f}",
+            f"Makespan: {self.makespan}",
+            f"Tiempo construcción: {self.tiempo_construccion:.4f}s",
+            "",
+            f"Eficiencia: {self.obtener_eficiencia_promedio():.2f} servicios/vehículo"
+        ]
+        
+        return "\n".join(resumen)
     
     def exportar_solucion(self, archivo_salida: str = None) -> None:
         """
@@ -389,17 +553,16 @@ Eficiencia: {self.obtener_eficiencia_promedio():.2f} servicios/vehículo
             archivo_salida = f"solucion_vsp_{self.nombre_instancia}.txt"
         
         try:
+            # Arma el contenido completo y lo escribe de una vez
+            partes = [self.obtener_resumen(), "\n\n=== RUTAS DETALLADAS ===\n"]
+            partes.extend(f"\n{ruta.obtener_resumen()}\n" for ruta in self.obtener_rutas_activas())
+            
+            partes.append(f"\n=== ESTADÍSTICAS ===\n")
+            stats = self.obtener_estadisticas_detalladas()
+            partes.extend(f"{clave}: {valor}\n" for clave, valor in stats.items())
+            
             with open(archivo_salida, 'w', encoding='utf-8') as archivo:
-                archivo.write(self.obtener_resumen())
-                archivo.write("\n\n=== RUTAS DETALLADAS ===\n")
-                
-                for i, ruta in enumerate(self.obtener_rutas_activas()):
-                    archivo.write(f"\n{ruta.obtener_resumen()}\n")
-                
-                archivo.write(f"\n=== ESTADÍSTICAS ===\n")
-                stats = self.obtener_estadisticas_detalladas()
-                for clave, valor in stats.items():
-                    archivo.write(f"{clave}: {valor}\n")
+                archivo.write("".join(partes))
             
             print(f"Solución exportada a: {archivo_salida}")
             
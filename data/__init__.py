@@ -1,16 +1,28 @@
 """
 Módulo de datos para problemas MDVSP y VSP.
 Proporciona funcionalidades para carga y gestión de instancias.
+
+Los submódulos se importan al primer acceso a cada nombre (PEP 562), así que un
+programa que solo trabaja con VSP no carga los modelos ni cargadores de MDVSP.
 """
 
-from .mdvsp_data_model import MDVSPData, Viaje, Deposito
-from .mdvsp_data_loader import MDVSPDataLoader
-from .vsp_data_model import VSPData, Servicio, DepositoVSP
-from .vsp_data_loader import VSPDataLoader
+import importlib
+
+# Nombre exportado -> submódulo que lo define
+_SUBMODULOS = {
+    'MDVSPData': '.mdvsp_data_model',
+    'Viaje': '.mdvsp_data_model',
+    'Deposito': '.mdvsp_data_model',
+    'MDVSPDataLoader': '.mdvsp_data_loader',
+    'VSPData': '.vsp_data_model',
+    'Servicio': '.vsp_data_model',
+    'DepositoVSP': '.vsp_data_model',
+    'VSPDataLoader': '.vsp_data_loader'
+}
 
 __all__ = [
     'MDVSPData',
-    'Viaje', 
+    'Viaje',
     'Deposito',
     'MDVSPDataLoader',
     'VSPData',
@@ -19,26 +31,28 @@ __all__ = [
     'VSPDataLoader'
 ]
 
-__version__ = '1.1.0'"""
-Módulo de datos para problemas MDVSP y VSP.
-Proporciona funcionalidades para carga y gestión de instancias.
-"""
+__version__ = '1.1.0'
 
-from .mdvsp_data_model import MDVSPData, Viaje, Deposito
-from .mdvsp_data_loader import MDVSPDataLoader
 
-from .vsp_data_model import VSPData, Servicio, DepositoVSP
-from .vsp_data_loader import VSPDataLoader
+def __getattr__(nombre: str):
+    """
+    Importa el submódulo que define un nombre exportado la primera vez que se usa.
+    
+    Args:
+        nombre: Nombre solicitado al paquete
+    
+    Returns:
+        Objeto exportado por el submódulo
+    """
+    submodulo = _SUBMODULOS.get(nombre)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    
+    valor = getattr(importlib.import_module(submodulo, __name__), nombre)
+    globals()[nombre] = valor
+    return valor
 
-__all__ = [
-    'MDVSPData',
-    'Viaje', 
-    'Deposito',
-    'MDVSPDataLoader',
-    'VSPData',
-    'Servicio',
-    'DepositoVSP',
-    'VSPDataLoader'
-]
 
-__version__ = '1.1.0'
\ No newline at end of file
+def __dir__():
+    """Incluye los nombres exportados aunque aún no se hayan importado."""
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
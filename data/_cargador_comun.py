@@ -0,0 +1,94 @@
+"""
+Funciones compartidas por los cargadores de instancias MDVSP y VSP.
+Ambos formatos usan un archivo .cst y un archivo .tim por instancia en un mismo directorio.
+También crea los pools de procesos que usan los cargadores y los algoritmos.
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+# memory_profiler traza cada línea de las funciones decoradas; solo se usa si se pide
+if os.environ.get("MDVSP_MEMPROFILE"):
+    from memory_profiler import profile
+else:
+    def profile(funcion):
+        """Devuelve la función sin instrumentar cuando no se perfila la memoria."""
+        return funcion
+
+
+def validar_directorio(directorio: Path) -> None:
+    """
+    Valida que el directorio de instancias exista y sea accesible.
+    
+    Args:
+        directorio: Ruta al directorio de instancias
+    """
+    if not directorio.exists():
+        raise FileNotFoundError(f"Directorio no encontrado: {directorio}")
+    
+    if not directorio.is_dir():
+        raise NotADirectoryError(f"La ruta no es un directorio: {directorio}")
+
+
+def listar_instancias(directorio: Path) -> List[str]:
+    """
+    Obtiene los nombres de las instancias que tienen archivo .cst y .tim en el directorio.
+    
+    Args:
+        directorio: Ruta al directorio de instancias
+    
+    Returns:
+        Lista ordenada de nombres de instancias sin extensión
+    """
+    archivos_cst = set()
+    archivos_tim = set()
+    
+    for archivo in directorio.iterdir():
+        if archivo.suffix == ".cst":
+            archivos_cst.add(archivo.stem)
+        elif archivo.suffix == ".tim":
+            archivos_tim.add(archivo.stem)
+    
+    # Retorna solo las instancias que tienen ambos archivos
+    return sorted(archivos_cst.intersection(archivos_tim))
+
+
+def numero_procesos(procesos: Optional[int], numero_tareas: int) -> int:
+    """
+    Determina cuántos procesos usar para un número dado de tareas.
+    
+    Args:
+        procesos: Número de procesos solicitado (None = uno por CPU; 1 = secuencial)
+        numero_tareas: Número de tareas a repartir
+    
+    Returns:
+        Número de procesos (1 = secuencial en el proceso actual)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    return max(1, min(procesos, numero_tareas))
+
+
+def crear_pool_procesos(procesos: Optional[int], numero_tareas: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Crea el pool de procesos para repartir tareas en paralelo.
+    
+    Args:
+        procesos: Número de procesos solicitado (None = uno por CPU; 1 = secuencial)
+        numero_tareas: Número de tareas a repartir
+    
+    Returns:
+        Pool de procesos o None si la ejecución debe ser secuencial
+    """
+    procesos = numero_procesos(procesos, numero_tareas)
+    if procesos <= 1:
+        return None
+    
+    # forkserver arranca procesos limpios sin heredar el estado del proceso principal
+    contexto = None
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        contexto = multiprocessing.get_context('forkserver')
+    
+    return ProcessPoolExecutor(max_workers=procesos, mp_context=contexto)
\ No newline at end of file
@@ -5,13 +5,118 @@ Implementa la lectura eficiente de archivos .cst y .tim con construcción dinám
 
 import os
 import time
+import warnings
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import IO, List, Tuple, Dict, Optional
 import numpy as np
-from memory_profiler import profile
+from numba import njit, prange
 
+from ._cargador_comun import profile, validar_directorio, listar_instancias, crear_pool_procesos
 from .mdvsp_data_model import MDVSPData, Deposito, Viaje
 
+# Versión del formato de las instancias en caché; debe incrementarse al cambiar la construcción de la matriz
+VERSION_CACHE_INSTANCIAS = 2
+
+
+def _leer_valores(archivo: IO, dtype: type) -> np.ndarray:
+    """
+    Lee los números separados por espacios en blanco desde la posición actual de un archivo.
+    
+    El parser en C de NumPy lee directamente del descriptor del archivo, sin cargar el
+    contenido en un str de Python. Un valor no numérico es un error; las versiones de
+    NumPy anteriores a 2.x solo emitían una advertencia y devolvían los valores leídos
+    hasta ese punto.
+    
+    Args:
+        archivo: Archivo abierto, posicionado al inicio de los valores
+        dtype: Tipo de los valores
+        
+    Returns:
+        Arreglo unidimensional con los valores en el orden del archivo
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromfile(archivo, dtype=dtype, sep=' ')
+        except DeprecationWarning as e:
+            raise ValueError(str(e)) from e
+
+
+
+def _compactar_matriz_costos(matriz: np.ndarray) -> np.ndarray:
+    """
+    Convierte la matriz de costos a int32 si todos sus valores son enteros representables.
+    
+    Las instancias tienen tiempos enteros y el costo infactible (1e8) cabe en int32, así que
+    la matriz ocupa la mitad que en float64. Si algún valor no es entero o no cabe, se
+    conserva la matriz float64.
+    
+    Args:
+        matriz: Matriz de costos float64
+        
+    Returns:
+        Matriz int32 con los mismos valores, o la matriz original
+    """
+    limites = np.iinfo(np.int32)
+    
+    # min/max también descartan los NaN antes de convertir
+    if not (matriz.size and limites.min <= matriz.min() and matriz.max() <= limites.max):
+        return matriz
+    
+    matriz_entera = matriz.astype(np.int32)
+    return matriz_entera if np.array_equal(matriz_entera, matriz) else matriz
+
+
+@njit(parallel=True, cache=True)
+def _aplicar_restricciones_viajes_kernel(matriz: np.ndarray, numero_depositos: int,
+                                         tiempos_inicio: np.ndarray, tiempos_fin: np.ndarray,
+                                         infactible: float) -> int:
+    """
+    Infactibiliza en el sitio las conexiones entre viajes que no cumplen la restricción temporal.
+    
+    Recorre una sola vez el bloque viaje-viaje sin máscaras intermedias; cada fila solo
+    escribe sus propias celdas, así que las filas se reparten entre hilos. El ciclo
+    interno no tiene saltos (la diagonal se restaura al final de cada fila), de modo que
+    LLVM lo vectoriza y la fila se procesa al ritmo de la memoria.
+    
+    Args:
+        matriz: Matriz de costos (depósitos + viajes) a modificar
+        numero_depositos: Número de depósitos (primeras filas y columnas de la matriz)
+        tiempos_inicio: Tiempo de inicio de cada viaje
+        tiempos_fin: Tiempo de fin de cada viaje
+        infactible: Costo que marca una conexión infactible
+        
+    Returns:
+        Número de conexiones entre viajes infactibilizadas
+    """
+    numero_viajes = tiempos_inicio.shape[0]
+    numero_infactibles = 0
+    
+    for i in prange(numero_viajes):
+        fila = matriz[numero_depositos + i, numero_depositos:]
+        tiempo_fin = tiempos_fin[i]
+        diagonal = fila[i]
+        infactibles_fila = 0
+        
+        for j in range(numero_viajes):
+            # Factible si tiempo fin i + tiempo desplazamiento <= tiempo inicio j
+            tiempo_desplazamiento = fila[j]
+            es_infactible = not ((tiempo_desplazamiento < infactible) &
+                                 (tiempo_fin + tiempo_desplazamiento <= tiempos_inicio[j]))
+            fila[j] = infactible if es_infactible else tiempo_desplazamiento
+            infactibles_fila += es_infactible
+        
+        # No considerar diagonal: se restaura y se descuenta si se contó
+        if not ((diagonal < infactible) & (tiempo_fin + diagonal <= tiempos_inicio[i])):
+            infactibles_fila -= 1
+        fila[i] = diagonal
+        
+        numero_infactibles += infactibles_fila
+    
+    return numero_infactibles
+
 
 class MDVSPDataLoader:
     """
@@ -19,23 +124,28 @@ class MDVSPDataLoader:
     Implementa restricciones de factibilidad temporal y manejo de puntos de cambio.
     """
     
-    def __init__(self, directorio_instancias: str = "fischetti") -> None:
+    def __init__(self, directorio_instancias: str = "fischetti",
+                 directorio_cache: Optional[str] = None,
+                 generar_diagnostico: bool = False) -> None:
         """
         Inicializa el cargador con el directorio de instancias.
         
         Args:
             directorio_instancias: Ruta al directorio que contiene los archivos de instancias
+            directorio_cache: Directorio para conservar las instancias ya procesadas en
+                formato .npz (None = leer siempre los archivos .cst y .tim)
+            generar_diagnostico: Si debe exportar cada matriz construida a matriz_costos.csv
         """
         self.directorio_instancias = Path(directorio_instancias)
         self._validar_directorio()
+        self.generar_diagnostico = generar_diagnostico
+        self.directorio_cache = Path(directorio_cache) if directorio_cache is not None else None
+        if self.directorio_cache is not None:
+            self.directorio_cache.mkdir(parents=True, exist_ok=True)
     
     def _validar_directorio(self) -> None:
         """Valida que el directorio de instancias exista y sea accesible."""
-        if not self.directorio_instancias.exists():
-            raise FileNotFoundError(f"Directorio no encontrado: {self.directorio_instancias}")
-        
-        if not self.directorio_instancias.is_dir():
-            raise NotADirectoryError(f"La ruta no es un directorio: {self.directorio_instancias}")
+        validar_directorio(self.directorio_instancias)
     
     def obtener_instancias_disponibles(self) -> List[str]:
         """
@@ -44,18 +154,7 @@ class MDVSPDataLoader:
         Returns:
             Lista de nombres de instancias sin extensión
         """
-        archivos_cst = set()
-        archivos_tim = set()
-        
-        for archivo in self.directorio_instancias.iterdir():
-            if archivo.suffix == ".cst":
-                archivos_cst.add(archivo.stem)
-            elif archivo.suffix == ".tim":
-                archivos_tim.add(archivo.stem)
-        
-        # Retorna solo las instancias que tienen ambos archivos
-        instancias_completas = sorted(archivos_cst.intersection(archivos_tim))
-        return instancias_completas
+        return listar_instancias(self.directorio_instancias)
     
     @profile
     def cargar_instancia(self, nombre_instancia: str) -> MDVSPData:
@@ -75,28 +174,25 @@ class MDVSPDataLoader:
         inicio_tiempo = time.perf_counter()
         
         try:
-            # Carga datos básicos
-            matriz_costos_base, depositos, numero_viajes = self._cargar_archivo_cst(nombre_instancia)
-            viajes = self._cargar_archivo_tim(nombre_instancia, numero_viajes)
-            
-            # Construye matriz de costos con restricciones dinámicas
-            matriz_costos_final = self._construir_matriz_costos_completa(
-                matriz_costos_base, depositos, viajes, numero_viajes
-            )
-            
-            # Calcula el total de vehículos
-            numero_total_vehiculos = sum(deposito.numero_vehiculos for deposito in depositos)
+            instancia = self._obtener_instancia_cache(nombre_instancia)
             
-            # Crea la instancia completa
-            instancia = MDVSPData(
-                nombre_archivo_instancia=nombre_instancia,
-                numero_depositos=len(depositos),
-                numero_viajes=numero_viajes,
-                numero_total_vehiculos=numero_total_vehiculos,
-                depositos=depositos,
-                viajes=viajes,
-                matriz_viajes=matriz_costos_final
-            )
+            if instancia is None:
+                # Carga datos básicos; el .tim se lee en otro hilo mientras se lee el .cst
+                # (NumPy libera el GIL al leer los valores del archivo)
+                with ThreadPoolExecutor(max_workers=1) as ejecutor:
+                    lectura_tim = ejecutor.submit(self._leer_archivo_tim, nombre_instancia)
+                    matriz_costos_base, depositos, numero_viajes = self._cargar_archivo_cst(nombre_instancia)
+                    viajes, tiempos_inicio, tiempos_fin = self._cargar_archivo_tim(
+                        nombre_instancia, numero_viajes, lectura_tim.result()
+                    )
+                
+                # Construye matriz de costos con restricciones dinámicas
+                matriz_costos_final = _compactar_matriz_costos(self._construir_matriz_costos_completa(
+                    matriz_costos_base, depositos, tiempos_inicio, tiempos_fin
+                ))
+                
+                instancia = self._crear_instancia(nombre_instancia, depositos, viajes, matriz_costos_final)
+                self._guardar_instancia_cache(nombre_instancia, instancia)
             
             tiempo_total = time.perf_counter() - inicio_tiempo
             print(f"Instancia {nombre_instancia} cargada en {tiempo_total:.4f} segundos")
@@ -106,6 +202,125 @@ class MDVSPDataLoader:
         except Exception as e:
             raise ValueError(f"Error cargando instancia {nombre_instancia}: {str(e)}") from e
     
+    @staticmethod
+    def _crear_instancia(nombre_instancia: str, depositos: List[Deposito], viajes: List[Viaje],
+                         matriz_costos: np.ndarray) -> MDVSPData:
+        """
+        Crea la instancia completa a partir de sus depósitos, viajes y matriz de costos.
+        
+        Args:
+            nombre_instancia: Nombre de la instancia sin extensión
+            depositos: Lista de depósitos
+            viajes: Lista de viajes
+            matriz_costos: Matriz de costos completa
+            
+        Returns:
+            Objeto MDVSPData con todos los datos
+        """
+        # Calcula el total de vehículos
+        numero_total_vehiculos = sum(deposito.numero_vehiculos for deposito in depositos)
+        
+        return MDVSPData(
+            nombre_archivo_instancia=nombre_instancia,
+            numero_depositos=len(depositos),
+            numero_viajes=len(viajes),
+            numero_total_vehiculos=numero_total_vehiculos,
+            depositos=depositos,
+            viajes=viajes,
+            matriz_viajes=matriz_costos
+        )
+    
+    def _obtener_archivo_cache(self, nombre_instancia: str) -> Optional[Path]:
+        """
+        Obtiene la ruta de la instancia en caché si está vigente.
+        
+        La copia es vigente si es posterior a los archivos .cst y .tim de la instancia.
+        
+        Args:
+            nombre_instancia: Nombre de la instancia sin extensión
+            
+        Returns:
+            Ruta del archivo .npz o None si no hay caché o está desactualizada
+        """
+        if self.directorio_cache is None:
+            return None
+        
+        archivo_cache = self.directorio_cache / f"{nombre_instancia}.npz"
+        try:
+            modificacion_cache = archivo_cache.stat().st_mtime
+            modificacion_fuentes = max(
+                (self.directorio_instancias / f"{nombre_instancia}{extension}").stat().st_mtime
+                for extension in (".cst", ".tim")
+            )
+        except OSError:
+            return None
+        
+        return archivo_cache if modificacion_cache >= modificacion_fuentes else None
+    
+    def _obtener_instancia_cache(self, nombre_instancia: str) -> Optional[MDVSPData]:
+        """
+        Reconstruye una instancia a partir de su copia .npz en caché.
+        
+        Args:
+            nombre_instancia: Nombre de la instancia sin extensión
+            
+        Returns:
+            Instancia reconstruida o None si no hay una copia vigente y legible
+        """
+        archivo_cache = self._obtener_archivo_cache(nombre_instancia)
+        if archivo_cache is None:
+            return None
+        
+        try:
+            with np.load(archivo_cache) as datos:
+                if int(datos['version']) != VERSION_CACHE_INSTANCIAS:
+                    return None
+                
+                matriz_costos = datos['matriz']
+                tiempos_inicio = datos['tiempos_inicio'].tolist()
+                tiempos_fin = datos['tiempos_fin'].tolist()
+                vehiculos = datos['vehiculos'].tolist()
+        except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+            # Copia corrupta o de un formato anterior: se vuelve a leer la instancia
+            return None
+        
+        depositos = [
+            Deposito(id_deposito=i, numero_vehiculos=numero_vehiculos)
+            for i, numero_vehiculos in enumerate(vehiculos)
+        ]
+        viajes = [
+            Viaje(id_viaje=i, tiempo_inicio=inicio, tiempo_fin=fin)
+            for i, (inicio, fin) in enumerate(zip(tiempos_inicio, tiempos_fin))
+        ]
+        
+        return self._crear_instancia(nombre_instancia, depositos, viajes, matriz_costos)
+    
+    def _guardar_instancia_cache(self, nombre_instancia: str, instancia: MDVSPData) -> None:
+        """
+        Guarda la matriz de costos, los tiempos y los vehículos de una instancia en caché.
+        
+        Args:
+            nombre_instancia: Nombre de la instancia sin extensión
+            instancia: Instancia ya construida
+        """
+        if self.directorio_cache is None:
+            return
+        
+        archivo_cache = self.directorio_cache / f"{nombre_instancia}.npz"
+        archivo_temporal = archivo_cache.with_name(f"{archivo_cache.name}.{os.getpid()}.tmp")
+        
+        # Se escribe en un archivo temporal para que otro proceso nunca lea una copia a medias
+        with open(archivo_temporal, 'wb') as archivo:
+            np.savez(
+                archivo,
+                version=np.int64(VERSION_CACHE_INSTANCIAS),
+                matriz=instancia.matriz_viajes,
+                tiempos_inicio=instancia.tiempos_inicio,
+                tiempos_fin=instancia.tiempos_fin,
+                vehiculos=np.array([deposito.numero_vehiculos for deposito in instancia.depositos], dtype=np.int64)
+            )
+        os.replace(archivo_temporal, archivo_cache)
+    
     def _cargar_archivo_cst(self, nombre_instancia: str) -> Tuple[np.ndarray, List[Deposito], int]:
         """
         Carga el archivo .cst con matriz de costos básica e información de depósitos.
@@ -121,7 +336,8 @@ class MDVSPDataLoader:
         if not archivo_cst.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {archivo_cst}")
         
-        with open(archivo_cst, 'r', encoding='utf-8') as archivo:
+        # En binario: la cabecera se convierte desde bytes y los valores los lee NumPy sin decodificar
+        with open(archivo_cst, 'rb') as archivo:
             try:
                 # Lee la primera línea que contiene: num_depositos num_viajes num_veh_dep1 num_veh_dep2 ...
                 primera_linea = archivo.readline().strip().split()
@@ -141,11 +357,10 @@ class MDVSPDataLoader:
                 if len(primera_linea) != (2 + numero_depositos):
                     raise ValueError(f"Primera línea debe contener {2 + numero_depositos} valores")
                 
-                depositos = []
-                for i in range(numero_depositos):
-                    numero_vehiculos = int(primera_linea[2 + i])
-                    deposito = Deposito(id_deposito=i, numero_vehiculos=numero_vehiculos)
-                    depositos.append(deposito)
+                depositos = [
+                    Deposito(id_deposito=i, numero_vehiculos=numero_vehiculos)
+                    for i, numero_vehiculos in enumerate(map(int, primera_linea[2:]))
+                ]
                 
                 # Lee matriz de costos base (distancias/tiempos entre puntos)
                 matriz_costos_base = self._leer_matriz_costos(archivo, numero_viajes + numero_depositos)
@@ -166,147 +381,129 @@ class MDVSPDataLoader:
         Returns:
             Matriz de costos como numpy array
         """
-        # Pre-alloca la matriz para mejor rendimiento
-        matriz = np.empty((dimension, dimension), dtype=np.float64)
-        
-        # Lee todos los valores restantes del archivo
-        contenido_restante = archivo.read()
-        valores = contenido_restante.split()
-        
-        if len(valores) != dimension * dimension:
-            raise ValueError(f"Número de valores en matriz ({len(valores)}) "
-                           f"no coincide con dimensión esperada ({dimension * dimension})")
-        
-        # Convierte y asigna valores de forma vectorizada
+        # Lee todos los valores restantes del archivo en C, sin cargar el texto en memoria
         try:
-            valores_numericos = np.array([float(valor) for valor in valores], dtype=np.float64)
-            matriz = valores_numericos.reshape((dimension, dimension))
+            valores_numericos = _leer_valores(archivo, np.float64)
         except ValueError as e:
             raise ValueError(f"Error convirtiendo valores de matriz: {str(e)}") from e
         
-        return matriz
+        if valores_numericos.size != dimension * dimension:
+            raise ValueError(f"Número de valores en matriz ({valores_numericos.size}) "
+                           f"no coincide con dimensión esperada ({dimension * dimension})")
+        
+        return valores_numericos.reshape((dimension, dimension))
     
-    def _cargar_archivo_tim(self, nombre_instancia: str, numero_viajes: int) -> List[Viaje]:
+    def _leer_archivo_tim(self, nombre_instancia: str) -> np.ndarray:
         """
-        Carga el archivo .tim con tiempos de inicio y fin de viajes.
+        Lee los valores del archivo .tim sin interpretarlos.
         
         Args:
             nombre_instancia: Nombre de la instancia
-            numero_viajes: Número esperado de viajes
             
         Returns:
-            Lista de objetos Viaje
+            Arreglo int64 con los tiempos en el orden del archivo
         """
         archivo_tim = self.directorio_instancias / f"{nombre_instancia}.tim"
         
         if not archivo_tim.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {archivo_tim}")
         
-        with open(archivo_tim, 'r', encoding='utf-8') as archivo:
+        with open(archivo_tim, 'rb') as archivo:
             try:
-                contenido = archivo.read()
-                valores = contenido.split()
-                
-                # Separa tiempos de inicio y fin
-                tiempos_inicio = [int(valores[i]) for i in range(numero_viajes)]
-                tiempos_fin = [int(valores[i + numero_viajes]) for i in range(numero_viajes)]
-                
-                # Crea objetos Viaje
-                viajes = []
-                for i in range(numero_viajes):
-                    viaje = Viaje(
-                        id_viaje=i,
-                        tiempo_inicio=tiempos_inicio[i],
-                        tiempo_fin=tiempos_fin[i]
-                    )
-                    viajes.append(viaje)
-                
-                return viajes
-                
-            except (ValueError, IndexError) as e:
+                return _leer_valores(archivo, np.int64)
+            except ValueError as e:
                 raise ValueError(f"Error en formato del archivo {archivo_tim}: {str(e)}") from e
     
+    def _cargar_archivo_tim(self, nombre_instancia: str, numero_viajes: int,
+                            valores: Optional[np.ndarray] = None) -> Tuple[List[Viaje], np.ndarray, np.ndarray]:
+        """
+        Carga el archivo .tim con tiempos de inicio y fin de viajes.
+        
+        Args:
+            nombre_instancia: Nombre de la instancia
+            numero_viajes: Número esperado de viajes
+            valores: Valores del archivo ya leídos con _leer_archivo_tim (None = leerlos aquí)
+            
+        Returns:
+            Tuple con lista de objetos Viaje y arreglos int64 de tiempos de inicio y de fin
+        """
+        if valores is None:
+            valores = self._leer_archivo_tim(nombre_instancia)
+        
+        archivo_tim = self.directorio_instancias / f"{nombre_instancia}.tim"
+        
+        try:
+            if valores.size < 2 * numero_viajes:
+                raise ValueError(f"Se esperaban {2 * numero_viajes} tiempos y el archivo "
+                                 f"tiene {valores.size}")
+            
+            # Separa tiempos de inicio y fin en arreglos contiguos
+            tiempos_inicio = valores[:numero_viajes]
+            tiempos_fin = valores[numero_viajes:2 * numero_viajes]
+            
+            # Crea objetos Viaje
+            viajes = []
+            for i, (tiempo_inicio, tiempo_fin) in enumerate(zip(tiempos_inicio.tolist(), tiempos_fin.tolist())):
+                viaje = Viaje(
+                    id_viaje=i,
+                    tiempo_inicio=tiempo_inicio,
+                    tiempo_fin=tiempo_fin
+                )
+                viajes.append(viaje)
+            
+            return viajes, tiempos_inicio, tiempos_fin
+            
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Error en formato del archivo {archivo_tim}: {str(e)}") from e
+    
     def _construir_matriz_costos_completa(self, matriz_base: np.ndarray, depositos: List[Deposito], 
-                                         viajes: List[Viaje], numero_viajes: int) -> np.ndarray:
+                                         tiempos_inicio: np.ndarray, tiempos_fin: np.ndarray) -> np.ndarray:
         """
         Construye la matriz de costos completa aplicando restricciones de factibilidad temporal.
         Integra la lógica del algoritmo C++ para construcción dinámica de matriz.
         
+        La matriz base se modifica en el sitio, sin reservar una segunda matriz del mismo
+        tamaño; el llamador no debe seguir usándola como matriz base.
+        
         Args:
             matriz_base: Matriz de costos básica leída del archivo
             depositos: Lista de depósitos
-            viajes: Lista de viajes con tiempos
-            numero_viajes: Número total de viajes
+            tiempos_inicio: Tiempo de inicio de cada viaje (int64)
+            tiempos_fin: Tiempo de fin de cada viaje (int64)
             
         Returns:
-            Matriz de costos final con restricciones aplicadas
+            Matriz de costos final con restricciones aplicadas (la misma matriz base)
         """
         INFACTIBLE = 100000000.0
         numero_depositos = len(depositos)
-        dimension_matriz = numero_depositos + numero_viajes
-        numero_aristas_infactibles = 0
         
-        # Copia la matriz base para modificarla
-        matriz_final = matriz_base.copy()
+        # La matriz leída del archivo solo se usa aquí, así que se modifica directamente
+        matriz_final = matriz_base
         
-        # Aplica restricciones específicas siguiendo la lógica del código C++
-        for i in range(dimension_matriz):
-            for j in range(dimension_matriz):
-                
-                # Si se están relacionando depósitos entre sí, infactibilizar
-                if i < numero_depositos and j < numero_depositos and i != j:
-                    matriz_final[i, j] = INFACTIBLE
-                    numero_aristas_infactibles += 1
-                
-                # Si se está relacionando un depósito consigo mismo, infactibilizar
-                elif i < numero_depositos and j < numero_depositos and i == j:
-                    matriz_final[i, j] = INFACTIBLE
-                    numero_aristas_infactibles += 1
-                
-                # Caso: salida de un depósito a atender un viaje
-                elif i < numero_depositos and j >= numero_depositos:
-                    # El costo ya está en la matriz base (distancia entre puntos)
-                    # Solo verificar que no sea infactible
-                    if matriz_final[i, j] >= INFACTIBLE:
-                        numero_aristas_infactibles += 1
-                
-                # Caso: llegada a un depósito después de atender un viaje
-                elif i >= numero_depositos and j < numero_depositos:
-                    # El costo ya está en la matriz base
-                    if matriz_final[i, j] >= INFACTIBLE:
-                        numero_aristas_infactibles += 1
-                
-                # Caso: relación entre viajes (restricciones temporales)
-                elif i >= numero_depositos and j >= numero_depositos:
-                    if i != j:  # No considerar diagonal
-                        # Obtiene índices de los viajes
-                        indice_viaje_i = i - numero_depositos
-                        indice_viaje_j = j - numero_depositos
-                        
-                        viaje_i = viajes[indice_viaje_i]
-                        viaje_j = viajes[indice_viaje_j]
-                        
-                        # Verifica factibilidad de itinerarios (tiempo fin i + tiempo desplazamiento <= tiempo inicio j)
-                        tiempo_desplazamiento = matriz_base[i, j]
-                        
-                        # Si el tiempo de desplazamiento está marcado como infactible, mantenerlo
-                        if tiempo_desplazamiento >= INFACTIBLE:
-                            matriz_final[i, j] = INFACTIBLE
-                            numero_aristas_infactibles += 1
-                        else:
-                            # Verifica restricción temporal
-                            if viaje_i.tiempo_fin + tiempo_desplazamiento <= viaje_j.tiempo_inicio:
-                                # Factible temporalmente, mantiene el costo de la matriz base
-                                pass  # matriz_final[i, j] ya tiene el valor correcto
-                            else:
-                                # Infactible por restricción temporal
-                                matriz_final[i, j] = INFACTIBLE
-                                numero_aristas_infactibles += 1
+        # Aplica restricciones específicas siguiendo la lógica del código C++, por bloques
+        # Relaciones entre depósitos (incluido un depósito consigo mismo): infactibles
+        matriz_final[:numero_depositos, :numero_depositos] = INFACTIBLE
+        numero_aristas_infactibles = numero_depositos * numero_depositos
+        
+        # Salidas de depósito a viaje y llegadas de viaje a depósito: el costo ya está en la
+        # matriz base, solo se cuentan las infactibles
+        numero_aristas_infactibles += int(np.count_nonzero(
+            matriz_final[:numero_depositos, numero_depositos:] >= INFACTIBLE
+        ))
+        numero_aristas_infactibles += int(np.count_nonzero(
+            matriz_final[numero_depositos:, :numero_depositos] >= INFACTIBLE
+        ))
+        
+        # Relaciones entre viajes: tiempo fin i + tiempo desplazamiento <= tiempo inicio j
+        numero_aristas_infactibles += _aplicar_restricciones_viajes_kernel(
+            matriz_final, numero_depositos, tiempos_inicio, tiempos_fin, INFACTIBLE
+        )
         
         print(f"Matriz de costos construida: {numero_aristas_infactibles} aristas infactibles")
         
         # Genera archivo de diagnóstico si es requerido
-        self._generar_archivo_diagnostico(matriz_final, nombre_instancia="matriz_costos.csv")
+        if self.generar_diagnostico:
+            self._generar_archivo_diagnostico(matriz_final, nombre_instancia="matriz_costos.csv")
         
         return matriz_final
     
@@ -323,18 +520,23 @@ class MDVSPDataLoader:
         try:
             with open(archivo_salida, 'w', encoding='utf-8') as archivo:
                 archivo.write(f"\n{nombre_instancia}\n")
-                
-                for i in range(matriz.shape[0]):
-                    fila = ";".join(f"{matriz[i, j]:.0f}" for j in range(matriz.shape[1]))
-                    archivo.write(f"{fila};\n")
+                np.savetxt(archivo, matriz, fmt='%.0f', delimiter=';', newline=';\n')
         
         except IOError as e:
             print(f"Advertencia: No se pudo generar archivo de diagnóstico: {e}")
     
-    def cargar_todas_las_instancias(self) -> List[MDVSPData]:
+    def cargar_todas_las_instancias(self, procesos: Optional[int] = 1) -> List[MDVSPData]:
         """
         Carga todas las instancias disponibles en el directorio.
         
+        La carga en paralelo es opcional: cada proceso tarda cerca de un segundo en arrancar,
+        las matrices vuelven serializadas al proceso principal y lo que imprimen los procesos
+        no pasa por la salida estándar del llamador.
+        
+        Args:
+            procesos: Número de procesos para cargar instancias en paralelo
+                (1 = secuencial en el proceso actual, por defecto; None = uno por CPU)
+        
         Returns:
             Lista de objetos MDVSPData con todas las instancias
         """
@@ -343,13 +545,28 @@ class MDVSPDataLoader:
         
         print(f"Cargando {len(instancias_disponibles)} instancias...")
         
-        for nombre_instancia in instancias_disponibles:
-            try:
-                instancia = self.cargar_instancia(nombre_instancia)
-                instancias_cargadas.append(instancia)
-                print(f"✓ {nombre_instancia} cargada exitosamente")
-            except Exception as e:
-                print(f"✗ Error cargando {nombre_instancia}: {str(e)}")
+        ejecutor = crear_pool_procesos(procesos, len(instancias_disponibles))
+        
+        try:
+            # Las cargas se lanzan todas y se recogen en orden para conservar el orden de la lista
+            cargas = [
+                ejecutor.submit(self.cargar_instancia, nombre_instancia) if ejecutor is not None else None
+                for nombre_instancia in instancias_disponibles
+            ]
+            
+            for nombre_instancia, carga in zip(instancias_disponibles, cargas):
+                try:
+                    if carga is not None:
+                        instancia = carga.result()
+                    else:
+                        instancia = self.cargar_instancia(nombre_instancia)
+                    instancias_cargadas.append(instancia)
+                    print(f"✓ {nombre_instancia} cargada exitosamente")
+                except Exception as e:
+                    print(f"✗ Error cargando {nombre_instancia}: {str(e)}")
+        finally:
+            if ejecutor is not None:
+                ejecutor.shutdown()
         
         return instancias_cargadas
     
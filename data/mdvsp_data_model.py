@@ -8,7 +8,7 @@ from typing import List, Optional, Dict, Tuple
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Viaje:
     """Representa un viaje individual en el problema MDVSP."""
     
@@ -41,7 +41,7 @@ class Viaje:
         return self.tiempo_inicio >= otro_viaje.tiempo_fin
 
 
-@dataclass
+@dataclass(slots=True)
 class Deposito:
     """Representa un depósito con su flota de vehículos disponibles."""
     
@@ -72,7 +72,7 @@ class MDVSPData:
     numero_total_vehiculos: int
     depositos: List[Deposito]
     viajes: List[Viaje]
-    matriz_viajes: np.ndarray
+    matriz_viajes: np.ndarray  # float64, o int32 si todos los costos son enteros
     
     # Constantes del modelo
     COSTO_INFACTIBLE: float = 100000000.0
@@ -123,6 +123,13 @@ class MDVSPData:
         # Precalcula índices de depósitos y viajes para acceso rápido
         self._indices_depositos = list(range(self.numero_viajes, self.numero_viajes + self.numero_depositos))
         self._indices_viajes = list(range(self.numero_viajes))
+        
+        # Ventanas temporales en arreglos contiguos para verificaciones vectorizadas
+        self.tiempos_inicio = np.array([viaje.tiempo_inicio for viaje in self.viajes], dtype=np.int64)
+        self.tiempos_fin = np.array([viaje.tiempo_fin for viaje in self.viajes], dtype=np.int64)
+        
+        # Conexiones factibles entre viajes en formato CSR, construidas al primer uso
+        self._sucesores_factibles: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
     
     def obtener_costo(self, origen: int, destino: int) -> float:
         """
@@ -153,7 +160,12 @@ class MDVSPData:
         Returns:
             True si la transición es factible, False en caso contrario
         """
-        return self.obtener_costo(origen, destino) != self.COSTO_INFACTIBLE
+        dimension = self.numero_viajes + self.numero_depositos
+        
+        if not (0 <= origen < dimension and 0 <= destino < dimension):
+            raise IndexError("Índices de origen o destino fuera de rango")
+        
+        return bool(self.matriz_viajes[origen, destino] != self.COSTO_INFACTIBLE)
     
     def es_factible_temporalmente(self, viaje_origen: int, viaje_destino: int) -> bool:
         """
@@ -169,10 +181,6 @@ class MDVSPData:
         if not (0 <= viaje_origen < self.numero_viajes and 0 <= viaje_destino < self.numero_viajes):
             raise IndexError("Índices de viajes fuera de rango")
         
-        # Obtiene los objetos de viaje
-        v_origen = self.viajes[viaje_origen]
-        v_destino = self.viajes[viaje_destino]
-        
         # Obtiene tiempo de desplazamiento de la matriz
         tiempo_desplazamiento = self.matriz_viajes[viaje_origen, viaje_destino]
         
@@ -180,7 +188,7 @@ class MDVSPData:
         if tiempo_desplazamiento == self.COSTO_INFACTIBLE:
             return False
         
-        return v_origen.tiempo_fin + tiempo_desplazamiento <= v_destino.tiempo_inicio
+        return bool(self.tiempos_fin[viaje_origen] + tiempo_desplazamiento <= self.tiempos_inicio[viaje_destino])
     
     def obtener_viajes_compatibles(self, viaje_origen: int) -> List[int]:
         """
@@ -192,13 +200,41 @@ class MDVSPData:
         Returns:
             Lista de índices de viajes compatibles
         """
-        compatibles = []
+        if not (0 <= viaje_origen < self.numero_viajes):
+            raise IndexError("Índices de viajes fuera de rango")
+        
+        inicios_fila, sucesores, _ = self.obtener_sucesores_factibles()
+        return sucesores[inicios_fila[viaje_origen]:inicios_fila[viaje_origen + 1]].tolist()
+    
+    def obtener_sucesores_factibles(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Obtiene las conexiones factibles entre viajes en formato CSR (filas comprimidas).
         
-        for viaje_destino in range(self.numero_viajes):
-            if viaje_destino != viaje_origen and self.es_factible_temporalmente(viaje_origen, viaje_destino):
-                compatibles.append(viaje_destino)
+        La mayoría de las conexiones entre viajes son infactibles, así que recorrer solo las
+        factibles evita leer la matriz densa completa. Se construye una vez y se reutiliza.
         
-        return compatibles
+        Returns:
+            Tupla (inicios_fila, sucesores, costos): los sucesores factibles del viaje i son
+            sucesores[inicios_fila[i]:inicios_fila[i + 1]], en orden creciente, con sus costos
+        """
+        if self._sucesores_factibles is None:
+            numero_viajes = self.numero_viajes
+            tiempos_desplazamiento = self.matriz_viajes[:numero_viajes, :numero_viajes]
+            
+            # Misma condición que es_factible_temporalmente, para todos los pares a la vez
+            factibles = ((tiempos_desplazamiento != self.COSTO_INFACTIBLE) &
+                         (self.tiempos_fin[:, None] + tiempos_desplazamiento <= self.tiempos_inicio[None, :]))
+            np.fill_diagonal(factibles, False)
+            
+            origenes, sucesores = np.nonzero(factibles)
+            inicios_fila = np.zeros(numero_viajes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(origenes, minlength=numero_viajes), out=inicios_fila[1:])
+            
+            self._sucesores_factibles = (
+                inicios_fila, sucesores.astype(np.int32), tiempos_desplazamiento[origenes, sucesores]
+            )
+        
+        return self._sucesores_factibles
     
     def obtener_deposito_mas_cercano(self, viaje_id: int) -> int:
         """
@@ -350,11 +386,23 @@ class MDVSPData:
         if len(secuencia_viajes) <= 1:
             return True
         
-        for i in range(len(secuencia_viajes) - 1):
-            viaje_actual = secuencia_viajes[i]
-            viaje_siguiente = secuencia_viajes[i + 1]
+        # Referencias locales para evitar búsquedas de atributos en el ciclo
+        numero_viajes = self.numero_viajes
+        matriz = self.matriz_viajes
+        tiempos_inicio = self.tiempos_inicio
+        tiempos_fin = self.tiempos_fin
+        costo_infactible = self.COSTO_INFACTIBLE
+        
+        for viaje_actual, viaje_siguiente in zip(secuencia_viajes, secuencia_viajes[1:]):
+            # El rango se valida por par, como en es_factible_temporalmente: un par
+            # infactible termina la validación antes de llegar a un índice fuera de rango
+            if not (0 <= viaje_actual < numero_viajes and 0 <= viaje_siguiente < numero_viajes):
+                raise IndexError("Índices de viajes fuera de rango")
             
-            if not self.es_factible_temporalmente(viaje_actual, viaje_siguiente):
+            tiempo_desplazamiento = matriz[viaje_actual, viaje_siguiente]
+            
+            if (tiempo_desplazamiento == costo_infactible or
+                tiempos_fin[viaje_actual] + tiempo_desplazamiento > tiempos_inicio[viaje_siguiente]):
                 return False
         
         return True
@@ -382,28 +430,27 @@ class MDVSPData:
         
         costo_total = 0.0
         indice_deposito = self.numero_viajes + deposito_origen
+        matriz = self.matriz_viajes
+        costo_infactible = self.COSTO_INFACTIBLE
         
         # Costo desde depósito al primer viaje
         primer_viaje = secuencia_viajes[0]
-        costo_inicial = self.matriz_viajes[indice_deposito, primer_viaje]
-        if costo_inicial == self.COSTO_INFACTIBLE:
+        costo_inicial = matriz[indice_deposito, primer_viaje]
+        if costo_inicial == costo_infactible:
             return None
         costo_total += costo_inicial
         
         # Costos entre viajes consecutivos
-        for i in range(len(secuencia_viajes) - 1):
-            viaje_actual = secuencia_viajes[i]
-            viaje_siguiente = secuencia_viajes[i + 1]
-            
-            costo_transicion = self.matriz_viajes[viaje_actual, viaje_siguiente]
-            if costo_transicion == self.COSTO_INFACTIBLE:
+        for viaje_actual, viaje_siguiente in zip(secuencia_viajes, secuencia_viajes[1:]):
+            costo_transicion = matriz[viaje_actual, viaje_siguiente]
+            if costo_transicion == costo_infactible:
                 return None
             costo_total += costo_transicion
         
         # Costo desde último viaje al depósito
         ultimo_viaje = secuencia_viajes[-1]
-        costo_final = self.matriz_viajes[ultimo_viaje, indice_deposito]
-        if costo_final == self.COSTO_INFACTIBLE:
+        costo_final = matriz[ultimo_viaje, indice_deposito]
+        if costo_final == costo_infactible:
             return None
         costo_total += costo_final
         
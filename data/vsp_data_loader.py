@@ -8,8 +8,8 @@ import time
 from pathlib import Path
 from typing import List, Tuple
 import numpy as np
-from memory_profiler import profile
 
+from data._cargador_comun import profile, validar_directorio, listar_instancias
 from data.vsp_data_model import VSPData, DepositoVSP, Servicio
 
 
@@ -19,23 +19,22 @@ class VSPDataLoader:
     Implementa restricciones de factibilidad temporal y de conexión.
     """
     
-    def __init__(self, directorio_instancias: str = "instancias_vsp") -> None:
+    def __init__(self, directorio_instancias: str = "instancias_vsp",
+                 generar_diagnostico: bool = False) -> None:
         """
         Inicializa el cargador con el directorio de instancias.
         
         Args:
             directorio_instancias: Ruta al directorio que contiene los archivos de instancias
+            generar_diagnostico: Si debe exportar cada matriz construida a un CSV de diagnóstico
         """
         self.directorio_instancias = Path(directorio_instancias)
         self._validar_directorio()
+        self.generar_diagnostico = generar_diagnostico
     
     def _validar_directorio(self) -> None:
         """Valida que el directorio de instancias exista y sea accesible."""
-        if not self.directorio_instancias.exists():
-            raise FileNotFoundError(f"Directorio no encontrado: {self.directorio_instancias}")
-        
-        if not self.directorio_instancias.is_dir():
-            raise NotADirectoryError(f"La ruta no es un directorio: {self.directorio_instancias}")
+        validar_directorio(self.directorio_instancias)
     
     def obtener_instancias_disponibles(self) -> List[str]:
         """
@@ -44,18 +43,7 @@ class VSPDataLoader:
         Returns:
             Lista de nombres de instancias sin extensión
         """
-        archivos_cst = set()
-        archivos_tim = set()
-        
-        for archivo in self.directorio_instancias.iterdir():
-            if archivo.suffix == ".cst":
-                archivos_cst.add(archivo.stem)
-            elif archivo.suffix == ".tim":
-                archivos_tim.add(archivo.stem)
-        
-        # Retorna solo las instancias que tienen ambos archivos
-        instancias_completas = sorted(archivos_cst.intersection(archivos_tim))
-        return instancias_completas
+        return listar_instancias(self.directorio_instancias)
     
     @profile
     def cargar_instancia_desde_archivos(self, archivo_cst: str, archivo_tim: str) -> VSPData:
@@ -186,10 +174,11 @@ class VSPDataLoader:
         if not archivo_cst.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {archivo_cst}")
         
-        with open(archivo_cst, 'r', encoding='utf-8') as archivo:
+        # Se lee en binario: int()/float() aceptan bytes, así que no se decodifica el archivo
+        with open(archivo_cst, 'rb') as archivo:
             try:
                 contenido = archivo.read()
-                lineas = contenido.strip().split('\n')
+                lineas = contenido.strip().split(b'\n')
                 
                 # Carga línea de cabecera
                 cabecera = lineas[0].split()
@@ -325,7 +314,8 @@ class VSPDataLoader:
         if not archivo_tim.exists():
             raise FileNotFoundError(f"Archivo no encontrado: {archivo_tim}")
         
-        with open(archivo_tim, 'r', encoding='utf-8') as archivo:
+        # Se lee en binario: int() acepta bytes, así que no se decodifica el archivo
+        with open(archivo_tim, 'rb') as archivo:
             try:
                 contenido = archivo.read()
                 valores = contenido.split()
@@ -443,8 +433,9 @@ class VSPDataLoader:
         
         print(f"Restricciones VSP aplicadas: {restricciones_aplicadas}")
         
-        # Genera archivo de diagnóstico
-        self._generar_archivo_diagnostico_vsp(matriz_final, servicios, nombre_instancia=f"{numero_servicios}_servicios_vsp.csv")
+        # Genera archivo de diagnóstico si es requerido
+        if self.generar_diagnostico:
+            self._generar_archivo_diagnostico_vsp(matriz_final, servicios, nombre_instancia=f"{numero_servicios}_servicios_vsp.csv")
         
         return matriz_final
     
@@ -493,9 +484,7 @@ class VSPDataLoader:
                 archivo.write("\n# Última fila/columna = Depósito\n\n")
                 
                 # Matriz de costos
-                for i in range(matriz.shape[0]):
-                    fila = ";".join(f"{matriz[i, j]:.0f}" for j in range(matriz.shape[1]))
-                    archivo.write(f"{fila};\n")
+                np.savetxt(archivo, matriz, fmt='%.0f', delimiter=';', newline=';\n')
         
         except IOError as e:
             print(f"Advertencia: No se pudo generar archivo de diagnóstico VSP: {e}")
@@ -4,7 +4,7 @@ Contiene las clases que representan servicios, depósitos y la instancia complet
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import numpy as np
 
 
@@ -90,11 +90,22 @@ class VSPData:
     servicios_ordenados_por_inicio: List[int] = field(default_factory=list)
     servicios_ordenados_por_fin: List[int] = field(default_factory=list)
     
+    # Conexiones factibles entre servicios y con el depósito (índice n), (n+1) x (n+1)
+    conexiones_factibles: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    
+    # Matriz de costos con la que se evalúan inserciones (int32 si los costos lo permiten)
+    matriz_puntuacion: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    
+    # Órdenes de servicios ya calculados por estrategia, compartidos entre ejecuciones
+    ordenes_servicios: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+    
     def __post_init__(self) -> None:
         """Valida la consistencia de los datos y construye estructuras auxiliares."""
         self._validar_datos()
         self._construir_estructuras_optimizacion()
         self._aplicar_restricciones_conexion()
+        self._construir_conexiones_factibles()
+        self._construir_matriz_puntuacion()
     
     def _validar_datos(self) -> None:
         """Valida la consistencia de los datos cargados."""
@@ -123,17 +134,16 @@ class VSPData:
     
     def _construir_estructuras_optimizacion(self) -> None:
         """Construye estructuras auxiliares para optimización de consultas."""
-        # Ordena servicios por tiempo de inicio
-        self.servicios_ordenados_por_inicio = sorted(
-            range(self.numero_servicios),
-            key=lambda i: self.servicios[i].tiempo_inicio
-        )
+        # Ventanas temporales en arreglos contiguos para cálculos vectorizados
+        self.tiempos_inicio = np.array([servicio.tiempo_inicio for servicio in self.servicios], dtype=np.int64)
+        self.tiempos_fin = np.array([servicio.tiempo_fin for servicio in self.servicios], dtype=np.int64)
+        self.duraciones = self.tiempos_fin - self.tiempos_inicio
+        
+        # Ordena servicios por tiempo de inicio (ordenamiento estable, como sorted)
+        self.servicios_ordenados_por_inicio = np.argsort(self.tiempos_inicio, kind='stable').tolist()
         
         # Ordena servicios por tiempo de finalización
-        self.servicios_ordenados_por_fin = sorted(
-            range(self.numero_servicios),
-            key=lambda i: self.servicios[i].tiempo_fin
-        )
+        self.servicios_ordenados_por_fin = np.argsort(self.tiempos_fin, kind='stable').tolist()
     
     def _aplicar_restricciones_conexion(self) -> None:
         """
@@ -157,6 +167,41 @@ class VSPData:
         
         print(f"Restricciones de conexión aplicadas: {restricciones_aplicadas} pares bidireccionales")
     
+    def _construir_conexiones_factibles(self) -> None:
+        """
+        Precalcula la factibilidad de todas las conexiones, incluidas las del depósito.
+        
+        Una conexión entre servicios es factible si su costo no está restringido y el
+        servicio origen termina antes de que empiece el destino (lo que además descarta
+        traslapes). Las conexiones con el depósito solo dependen de su costo.
+        """
+        n = self.numero_servicios
+        costos = self.matriz_costos
+        
+        factibles = (costos != self.COSTO_INFACTIBLE) & (costos != self.COSTO_PROHIBIDO)
+        factibles[:n, :n] &= self.tiempos_fin[:, None] <= self.tiempos_inicio[None, :]
+        np.fill_diagonal(factibles, False)
+        
+        self.conexiones_factibles = factibles
+    
+    def _construir_matriz_puntuacion(self) -> None:
+        """
+        Prepara la matriz con la que se evalúan los costos de inserción.
+        
+        Las instancias tienen costos enteros, así que se guarda una copia int32 que ocupa
+        la mitad que la matriz float64 y es exacta. Si algún costo no es entero o la suma
+        de tres costos podría desbordar int32, se usa la matriz de costos en float64 (sin
+        copiarla si ya lo está), que es el otro tipo para el que se compilan los kernels.
+        """
+        matriz = self.matriz_costos
+        limite_entero = np.iinfo(np.int32).max
+        
+        if (matriz.size and 3 * float(np.abs(matriz).max()) < limite_entero
+                and np.array_equal(matriz, np.rint(matriz))):
+            self.matriz_puntuacion = matriz.astype(np.int32)
+        else:
+            self.matriz_puntuacion = matriz.astype(np.float64, copy=False)
+    
     def es_conexion_factible(self, servicio_origen: int, servicio_destino: int) -> bool:
         """
         Verifica si la conexión entre dos servicios es factible.
@@ -172,20 +217,7 @@ class VSPData:
                 0 <= servicio_destino < self.numero_servicios):
             raise IndexError("Índices de servicios fuera de rango")
         
-        if servicio_origen == servicio_destino:
-            return False
-        
-        # Verifica restricciones de matriz de costos
-        costo = self.matriz_costos[servicio_origen, servicio_destino]
-        if costo == self.COSTO_INFACTIBLE or costo == self.COSTO_PROHIBIDO:
-            return False
-        
-        # Verifica restricciones temporales
-        servicio_o = self.servicios[servicio_origen]
-        servicio_d = self.servicios[servicio_destino]
-        
-        # No debe haber traslapes y debe respetar precedencia temporal
-        return servicio_o.puede_preceder_a(servicio_d) and not servicio_o.se_traslapa_con(servicio_d)
+        return bool(self.conexiones_factibles[servicio_origen, servicio_destino])
     
     def obtener_costo_conexion(self, servicio_origen: int, servicio_destino: int) -> float:
         """
@@ -288,6 +320,39 @@ class VSPData:
         
         return servicios_conectores
     
+    def validar_secuencia_servicios(self, secuencia_servicios: Sequence[int]) -> Tuple[bool, str]:
+        """
+        Valida si una secuencia de servicios es una ruta factible que sale y vuelve al depósito.
+        
+        Todos los tramos (incluidos los del depósito) se consultan de una vez en
+        conexiones_factibles, sin recorrer la secuencia en Python.
+        
+        Args:
+            secuencia_servicios: Secuencia ordenada de IDs de servicios
+            
+        Returns:
+            Tupla (es_factible, mensaje); el mensaje describe el primer tramo infactible
+        """
+        secuencia = np.asarray(secuencia_servicios, dtype=np.intp)
+        if not secuencia.size:
+            return True, ""
+        
+        if ((secuencia < 0) | (secuencia >= self.numero_servicios)).any():
+            return False, "Índices de servicios fuera de rango"
+        
+        # Recorrido completo: depósito -> servicios -> depósito
+        indice_deposito = self.numero_servicios
+        recorrido = np.concatenate(([indice_deposito], secuencia, [indice_deposito]))
+        tramos_factibles = self.conexiones_factibles[recorrido[:-1], recorrido[1:]]
+        
+        if tramos_factibles.all():
+            return True, ""
+        
+        tramo = int(np.argmin(tramos_factibles))
+        origen, destino = (("depósito" if nodo == indice_deposito else str(nodo))
+                           for nodo in recorrido[tramo:tramo + 2].tolist())
+        return False, f"Conexión infactible {origen} -> {destino}"
+    
     def obtener_estadisticas(self) -> dict:
         """
         Calcula estadísticas detalladas de la instancia VSP.
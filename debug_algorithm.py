@@ -81,7 +81,7 @@ def debug_instancia_simple():
     # 4. VERIFICAR RESULTADOS
     print(f"\n4. ANÁLISIS DE RESULTADOS")
     print("-" * 50)
-    print(f"Viajes asignados: {len(solucion.viajes_asignados)}/{instancia.numero_viajes}")
+    print(f"Viajes asignados: {solucion.contar_viajes_asignados()}/{instancia.numero_viajes}")
     print(f"Costo total: {solucion.costo_total:,.0f}")
     print(f"Vehículos usados: {solucion.numero_vehiculos_usados}")
     print(f"Factible: {solucion.es_factible}")
@@ -170,7 +170,10 @@ class ConcurrentScheduleDebug:
         """Inicializa solución con rutas vacías."""
         from algorithms.solution_model import SolucionMDVSP, Ruta
         
-        solucion = SolucionMDVSP(nombre_instancia=instancia.nombre_archivo_instancia)
+        solucion = SolucionMDVSP(
+            nombre_instancia=instancia.nombre_archivo_instancia,
+            viajes_asignados=np.zeros(instancia.numero_viajes, dtype=bool)
+        )
         
         id_vehiculo = 0
         for deposito in instancia.depositos:
@@ -259,7 +262,7 @@ class ConcurrentScheduleDebug:
         viaje = instancia.viajes[id_viaje]
         
         print(f"    Asignando viaje {id_viaje} a ruta {id_ruta}")
-        print(f"    Ruta antes: {ruta.viajes}")
+        print(f"    Ruta antes: {ruta.viajes.tolist()}")
         
         if ruta.es_vacia():
             ruta.agregar_viaje(id_viaje, costo, viaje.tiempo_inicio, viaje.tiempo_fin)
@@ -273,10 +276,10 @@ class ConcurrentScheduleDebug:
             if viaje.tiempo_fin > ruta.tiempo_fin:
                 ruta.tiempo_fin = viaje.tiempo_fin
         
-        print(f"    Ruta después: {ruta.viajes}")
+        print(f"    Ruta después: {ruta.viajes.tolist()}")
         print(f"    Costo ruta: {ruta.costo_total:.0f}")
         
-        solucion.viajes_asignados.add(id_viaje)
+        solucion.viajes_asignados[id_viaje] = True
 
 
 if __name__ == "__main__":
@@ -6,11 +6,11 @@ Recibe paths de archivos .tim, .cst y .solucion como parámetros.
 import sys
 import argparse
 from pathlib import Path
-from memory_profiler import profile
 
 # Agrega directorios al path para importar módulos
 sys.path.append(str(Path(__file__).parent))
 
+from data._cargador_comun import profile
 from data.vsp_data_loader import VSPDataLoader
 from algorithms.vsp_constructive import VSPConstructiveAlgorithm
 
@@ -83,7 +83,7 @@ def main():
         print(f"\n=== SOLUCIÓN ENCONTRADA ===")
         print(f"Factible: {'Sí' if solucion.es_factible else 'No'}")
         print(f"Vehículos usados: {solucion.numero_vehiculos_usados}")
-        print(f"Servicios asignados: {len(solucion.servicios_asignados)}")
+        print(f"Servicios asignados: {solucion.contar_servicios_asignados()}")
         print(f"Costo total: {solucion.costo_total:.0f}")
         print(f"Tiempo construcción: {solucion.tiempo_construccion:.4f}s")
         
@@ -6,7 +6,6 @@ Demuestra el uso del cargador y verifica el rendimiento de carga.
 import sys
 import time
 from pathlib import Path
-from memory_profiler import profile
 
 # Agrega el directorio padre al path para importar módulos
 sys.path.append(str(Path(__file__).parent))